@@ -20,23 +20,93 @@ Three-layer architecture:
 from fastmcp import FastMCP
 import json
 import math
-from typing import Optional
+import os
+import sys
+from bisect import bisect_right
+from functools import lru_cache, wraps
+from heapq import nlargest
+from operator import itemgetter
+from types import MappingProxyType
+from typing import NamedTuple, Optional
+
+try:
+    import orjson
+except ImportError:  # optional accelerator — stdlib json is the fallback
+    orjson = None
+
+# WATERCOLOR_MCP_PRETTY=0/false/no/off makes every response compact JSON
+# (read once at import; responses are indented by default)
+_PRETTY = os.environ.get("WATERCOLOR_MCP_PRETTY", "1").strip().lower() not in (
+    "0", "false", "no", "off",
+)
 
 mcp = FastMCP("Watercolor Dissolution")
 
+
+# Immutable records for the flat per-mode taxonomies. Converted with
+# _asdict() only at the JSON boundary.
+
+class EdgeMode(NamedTuple):
+    """Edge negotiation mode."""
+    name: str
+    description: str
+    visual_effect: str
+    dissolution_resistance: float
+    typical_context: str
+
+
+class HydrologyState(NamedTuple):
+    """Pigment hydrology state."""
+    name: str
+    description: str
+    water_ratio: float
+    pigment_concentration: float
+    drying_behavior: str
+    visual_character: str
+
+
+class SubstrateType(NamedTuple):
+    """Paper / substrate type."""
+    name: str
+    description: str
+    tooth: float
+    absorbency: float
+    texture_visibility: float
+    best_for: str
+
+
+class ContrastCurve(NamedTuple):
+    """Watercolor contrast curve."""
+    name: str
+    description: str
+    toe_compression: float
+    shoulder_rolloff: float
+    midtone_contrast: float
+    visual_effect: str
+
+
 # ─────────────────────────────────────────────────────────────────────
 # TAXONOMY DATA — Layer 1 (pure reference, 0 tokens)
+#
+# Top-level taxonomies are read-only MappingProxyType views; wrap them in
+# dict() (or _records_json for NamedTuple records) before handing to _dumps.
+# Only the top level is read-only: the nested dicts and lists (centers,
+# keywords, optical properties, ...) stay plain, are shared with cached
+# results and responses, and must not be mutated after import.
 # ─────────────────────────────────────────────────────────────────────
 
-PARAMETER_NAMES = [
+# Interned so every state[k] lookup hits the identity fast path in dict lookup
+PARAMETER_NAMES = tuple(sys.intern(k) for k in (
     "dissolution_rate",
     "edge_coherence",
     "substrate_visibility",
     "pigment_hydrology",
     "anchor_density",
-]
+))
+# Axis keys unpacked once, for hand-unrolled per-axis code
+_K0, _K1, _K2, _K3, _K4 = PARAMETER_NAMES
 
-VISUAL_TYPES = {
+VISUAL_TYPES = MappingProxyType({
     "editorial_wash": {
         "name": "Editorial Wash",
         "description": (
@@ -264,10 +334,18 @@ VISUAL_TYPES = {
             "chromatic tide covering substrate",
         ],
     },
-}
+})
+
+# Intern the vocabulary strings so repeated phrases share one object and
+# later membership tests can short-circuit on identity
+for _t in VISUAL_TYPES.values():
+    _t["description"] = sys.intern(_t["description"])
+    _t["keywords"] = [sys.intern(k) for k in _t["keywords"]]
+    _t["color_associations"] = [sys.intern(c) for c in _t["color_associations"]]
+del _t
 
 # 10 canonical states: 6 visual types + 4 interpolated positions
-CANONICAL_STATES = {
+CANONICAL_STATES = MappingProxyType({
     "editorial_wash": {
         "name": "Editorial Wash",
         "coordinates": VISUAL_TYPES["editorial_wash"]["center"],
@@ -346,144 +424,144 @@ CANONICAL_STATES = {
         "source": "interpolated",
         "description": "substrate_emergence → ghost_impression at 50%",
     },
-}
+})
 
 # Contrast curves specific to watercolor dissolution behavior
-EDGE_MODES = {
-    "architectural_hard": {
-        "name": "Architectural Hard Edge",
-        "description": "Sharp boundary where built structure meets dissolution field. Brick mortar lines, rooflines, window frames retaining photographic precision.",
-        "visual_effect": "Clean geometric cut through painterly atmosphere",
-        "dissolution_resistance": 0.95,
-        "typical_context": "Building edges, structural elements, geometric objects",
-    },
-    "cauliflower_backrun": {
-        "name": "Cauliflower Backrun",
-        "description": "Irregular organic edge where wet pigment meets damp pigment, creating fractal-like bloom patterns. Named for resemblance to cauliflower florets.",
-        "visual_effect": "Organic fractal boundary with pigment concentration at rim",
-        "dissolution_resistance": 0.15,
-        "typical_context": "Wash boundaries, drying fronts, pigment pooling edges",
-    },
-    "feathered_bleed": {
-        "name": "Feathered Bleed",
-        "description": "Soft gradient boundary where pigment diffuses into wet paper. No hard stop — color fades gradually into substrate or adjacent wash.",
-        "visual_effect": "Smooth gradient transition from saturated to transparent",
-        "dissolution_resistance": 0.05,
-        "typical_context": "Sky gradients, atmospheric diffusion, background washes",
-    },
-    "silhouette_cut": {
-        "name": "Silhouette Cut",
-        "description": "Sharp object boundary maintained by value contrast rather than line. Dark figure against light wash, or vice versa. The photographic substrate asserts through contrast.",
-        "visual_effect": "High-contrast shape recognition persisting through dissolution",
-        "dissolution_resistance": 0.80,
-        "typical_context": "Human figures, strong-silhouette objects (fire hydrants, trees)",
-    },
-    "granulation_boundary": {
-        "name": "Granulation Boundary",
-        "description": "Textured edge where heavy pigment particles separate from vehicle, settling into paper tooth. Creates a stippled, grainy transition zone.",
-        "visual_effect": "Particulate transition revealing paper micro-texture",
-        "dissolution_resistance": 0.30,
-        "typical_context": "Earth tones, mineral pigments, textured paper surfaces",
-    },
-    "wet_lift": {
-        "name": "Wet Lift Edge",
-        "description": "Boundary created by removing pigment from wet surface. Lighter than surrounding wash. Reveals paper through subtraction rather than addition.",
-        "visual_effect": "Negative-space edge — light through dark rather than dark on light",
-        "dissolution_resistance": 0.40,
-        "typical_context": "Highlights, reflections, light sources, lifted cloud edges",
-    },
-}
+EDGE_MODES = MappingProxyType({
+    "architectural_hard": EdgeMode(
+        name="Architectural Hard Edge",
+        description="Sharp boundary where built structure meets dissolution field. Brick mortar lines, rooflines, window frames retaining photographic precision.",
+        visual_effect="Clean geometric cut through painterly atmosphere",
+        dissolution_resistance=0.95,
+        typical_context="Building edges, structural elements, geometric objects",
+    ),
+    "cauliflower_backrun": EdgeMode(
+        name="Cauliflower Backrun",
+        description="Irregular organic edge where wet pigment meets damp pigment, creating fractal-like bloom patterns. Named for resemblance to cauliflower florets.",
+        visual_effect="Organic fractal boundary with pigment concentration at rim",
+        dissolution_resistance=0.15,
+        typical_context="Wash boundaries, drying fronts, pigment pooling edges",
+    ),
+    "feathered_bleed": EdgeMode(
+        name="Feathered Bleed",
+        description="Soft gradient boundary where pigment diffuses into wet paper. No hard stop — color fades gradually into substrate or adjacent wash.",
+        visual_effect="Smooth gradient transition from saturated to transparent",
+        dissolution_resistance=0.05,
+        typical_context="Sky gradients, atmospheric diffusion, background washes",
+    ),
+    "silhouette_cut": EdgeMode(
+        name="Silhouette Cut",
+        description="Sharp object boundary maintained by value contrast rather than line. Dark figure against light wash, or vice versa. The photographic substrate asserts through contrast.",
+        visual_effect="High-contrast shape recognition persisting through dissolution",
+        dissolution_resistance=0.80,
+        typical_context="Human figures, strong-silhouette objects (fire hydrants, trees)",
+    ),
+    "granulation_boundary": EdgeMode(
+        name="Granulation Boundary",
+        description="Textured edge where heavy pigment particles separate from vehicle, settling into paper tooth. Creates a stippled, grainy transition zone.",
+        visual_effect="Particulate transition revealing paper micro-texture",
+        dissolution_resistance=0.30,
+        typical_context="Earth tones, mineral pigments, textured paper surfaces",
+    ),
+    "wet_lift": EdgeMode(
+        name="Wet Lift Edge",
+        description="Boundary created by removing pigment from wet surface. Lighter than surrounding wash. Reveals paper through subtraction rather than addition.",
+        visual_effect="Negative-space edge — light through dark rather than dark on light",
+        dissolution_resistance=0.40,
+        typical_context="Highlights, reflections, light sources, lifted cloud edges",
+    ),
+})
 
 # Pigment hydrology states
-HYDROLOGY_STATES = {
-    "dry_brush": {
-        "name": "Dry Brush",
-        "description": "Minimal water — pigment dragged across paper surface. Paper tooth catches pigment on high points, leaving valleys white. Maximum texture revelation.",
-        "water_ratio": 0.05,
-        "pigment_concentration": 0.90,
-        "drying_behavior": "instant",
-        "visual_character": "Broken, textured marks showing paper grain",
-    },
-    "controlled_wash": {
-        "name": "Controlled Wash",
-        "description": "Balanced water-to-pigment ratio. Even coverage with predictable edges. The workhorse technique — sufficient water for flow, enough pigment for saturation.",
-        "water_ratio": 0.40,
-        "pigment_concentration": 0.60,
-        "drying_behavior": "even_recession",
-        "visual_character": "Smooth even coverage with controlled edge quality",
-    },
-    "wet_on_dry": {
-        "name": "Wet on Dry",
-        "description": "Wet pigment applied to dry paper or dried wash. Creates hard edges where wet meets dry. Layering technique — each layer dries completely before next.",
-        "water_ratio": 0.55,
-        "pigment_concentration": 0.45,
-        "drying_behavior": "hard_edge_formation",
-        "visual_character": "Crisp layered washes with visible overlap edges",
-    },
-    "wet_on_wet": {
-        "name": "Wet on Wet",
-        "description": "Wet pigment into wet surface. Colors merge and diffuse unpredictably. Bloom formation. Soft edges everywhere. Requires timing and acceptance of partial control.",
-        "water_ratio": 0.75,
-        "pigment_concentration": 0.30,
-        "drying_behavior": "bloom_formation",
-        "visual_character": "Soft diffused edges with pigment migration and bloom",
-    },
-    "flooding": {
-        "name": "Flooding",
-        "description": "Excess water carrying dilute pigment. Gravity becomes co-artist — drips, runs, pooling. Capillary action pulls pigment into paper fibers. Maximum unpredictability.",
-        "water_ratio": 0.92,
-        "pigment_concentration": 0.12,
-        "drying_behavior": "gravity_pooling_capillary",
-        "visual_character": "Gravity-driven flow with capillary branching and pooling",
-    },
-}
+HYDROLOGY_STATES = MappingProxyType({
+    "dry_brush": HydrologyState(
+        name="Dry Brush",
+        description="Minimal water — pigment dragged across paper surface. Paper tooth catches pigment on high points, leaving valleys white. Maximum texture revelation.",
+        water_ratio=0.05,
+        pigment_concentration=0.90,
+        drying_behavior="instant",
+        visual_character="Broken, textured marks showing paper grain",
+    ),
+    "controlled_wash": HydrologyState(
+        name="Controlled Wash",
+        description="Balanced water-to-pigment ratio. Even coverage with predictable edges. The workhorse technique — sufficient water for flow, enough pigment for saturation.",
+        water_ratio=0.40,
+        pigment_concentration=0.60,
+        drying_behavior="even_recession",
+        visual_character="Smooth even coverage with controlled edge quality",
+    ),
+    "wet_on_dry": HydrologyState(
+        name="Wet on Dry",
+        description="Wet pigment applied to dry paper or dried wash. Creates hard edges where wet meets dry. Layering technique — each layer dries completely before next.",
+        water_ratio=0.55,
+        pigment_concentration=0.45,
+        drying_behavior="hard_edge_formation",
+        visual_character="Crisp layered washes with visible overlap edges",
+    ),
+    "wet_on_wet": HydrologyState(
+        name="Wet on Wet",
+        description="Wet pigment into wet surface. Colors merge and diffuse unpredictably. Bloom formation. Soft edges everywhere. Requires timing and acceptance of partial control.",
+        water_ratio=0.75,
+        pigment_concentration=0.30,
+        drying_behavior="bloom_formation",
+        visual_character="Soft diffused edges with pigment migration and bloom",
+    ),
+    "flooding": HydrologyState(
+        name="Flooding",
+        description="Excess water carrying dilute pigment. Gravity becomes co-artist — drips, runs, pooling. Capillary action pulls pigment into paper fibers. Maximum unpredictability.",
+        water_ratio=0.92,
+        pigment_concentration=0.12,
+        drying_behavior="gravity_pooling_capillary",
+        visual_character="Gravity-driven flow with capillary branching and pooling",
+    ),
+})
 
 # Substrate types
-SUBSTRATE_TYPES = {
-    "hot_press": {
-        "name": "Hot Press (Smooth)",
-        "description": "Smooth surface. Pigment sits on top rather than settling into valleys. Allows fine detail but washes can be uneven. Colors appear more vivid.",
-        "tooth": 0.10,
-        "absorbency": 0.30,
-        "texture_visibility": 0.15,
-        "best_for": "Fine detail, illustration, controlled washes",
-    },
-    "cold_press": {
-        "name": "Cold Press (Medium Texture)",
-        "description": "Standard watercolor paper. Moderate tooth provides texture without fighting detail. Most versatile — handles wet and dry techniques. The default.",
-        "tooth": 0.50,
-        "absorbency": 0.55,
-        "texture_visibility": 0.50,
-        "best_for": "General purpose, balanced wet and dry techniques",
-    },
-    "rough": {
-        "name": "Rough",
-        "description": "Heavy texture with deep valleys and high peaks. Dry brush skips across peaks creating maximum broken-texture effect. Washes settle unevenly, creating granulation.",
-        "tooth": 0.85,
-        "absorbency": 0.70,
-        "texture_visibility": 0.85,
-        "best_for": "Expressive texture, dry brush, atmospheric effects",
-    },
-    "yupo": {
-        "name": "Yupo (Non-absorbent Synthetic)",
-        "description": "Non-absorbent plastic surface. Pigment floats on top and can be moved indefinitely. Creates unique lifting and pooling effects. No paper grain.",
-        "tooth": 0.02,
-        "absorbency": 0.02,
-        "texture_visibility": 0.05,
-        "best_for": "Experimental effects, lifting, extended working time",
-    },
-    "masa": {
-        "name": "Masa (Japanese)",
-        "description": "Thin, absorbent Japanese paper. Pigment spreads rapidly through fibers. Very soft feathered edges. Ink-wash aesthetic. Fragile when wet.",
-        "tooth": 0.20,
-        "absorbency": 0.90,
-        "texture_visibility": 0.25,
-        "best_for": "Sumi-e aesthetic, rapid feathered diffusion, ink wash",
-    },
-}
+SUBSTRATE_TYPES = MappingProxyType({
+    "hot_press": SubstrateType(
+        name="Hot Press (Smooth)",
+        description="Smooth surface. Pigment sits on top rather than settling into valleys. Allows fine detail but washes can be uneven. Colors appear more vivid.",
+        tooth=0.10,
+        absorbency=0.30,
+        texture_visibility=0.15,
+        best_for="Fine detail, illustration, controlled washes",
+    ),
+    "cold_press": SubstrateType(
+        name="Cold Press (Medium Texture)",
+        description="Standard watercolor paper. Moderate tooth provides texture without fighting detail. Most versatile — handles wet and dry techniques. The default.",
+        tooth=0.50,
+        absorbency=0.55,
+        texture_visibility=0.50,
+        best_for="General purpose, balanced wet and dry techniques",
+    ),
+    "rough": SubstrateType(
+        name="Rough",
+        description="Heavy texture with deep valleys and high peaks. Dry brush skips across peaks creating maximum broken-texture effect. Washes settle unevenly, creating granulation.",
+        tooth=0.85,
+        absorbency=0.70,
+        texture_visibility=0.85,
+        best_for="Expressive texture, dry brush, atmospheric effects",
+    ),
+    "yupo": SubstrateType(
+        name="Yupo (Non-absorbent Synthetic)",
+        description="Non-absorbent plastic surface. Pigment floats on top and can be moved indefinitely. Creates unique lifting and pooling effects. No paper grain.",
+        tooth=0.02,
+        absorbency=0.02,
+        texture_visibility=0.05,
+        best_for="Experimental effects, lifting, extended working time",
+    ),
+    "masa": SubstrateType(
+        name="Masa (Japanese)",
+        description="Thin, absorbent Japanese paper. Pigment spreads rapidly through fibers. Very soft feathered edges. Ink-wash aesthetic. Fragile when wet.",
+        tooth=0.20,
+        absorbency=0.90,
+        texture_visibility=0.25,
+        best_for="Sumi-e aesthetic, rapid feathered diffusion, ink wash",
+    ),
+})
 
 # Rhythmic presets (Phase 2.6)
-RHYTHMIC_PRESETS = {
+RHYTHMIC_PRESETS = MappingProxyType({
     "fidelity_breathing": {
         "name": "Fidelity Breathing",
         "description": "Slow oscillation between photographic fidelity and painterly dissolution",
@@ -524,10 +602,10 @@ RHYTHMIC_PRESETS = {
         "period": 24,
         "character": "Complete journey from controlled photography through dissolution to abstract flood",
     },
-}
+})
 
 # Attractor presets
-ATTRACTOR_PRESETS = {
+ATTRACTOR_PRESETS = MappingProxyType({
     "editorial_discipline": {
         "name": "Editorial Discipline",
         "description": "Photographic control with watercolor as accent",
@@ -570,10 +648,10 @@ ATTRACTOR_PRESETS = {
         "state": CANONICAL_STATES["restrained_study"]["coordinates"],
         "basin_radius": 0.18,
     },
-}
+})
 
 # Color harmony modes
-COLOR_HARMONY_MODES = {
+COLOR_HARMONY_MODES = MappingProxyType({
     "source_inherited": {
         "name": "Source Inherited",
         "description": "Watercolor palette derived from photographic source colors — washes in the same hue family as original content",
@@ -599,111 +677,276 @@ COLOR_HARMONY_MODES = {
         "description": "Faded, low-chroma palette as if watercolor has aged or been sun-bleached",
         "visual_effect": "Temporal patina over dissolution — aged document quality",
     },
-}
+})
 
 # Contrast curves
-CONTRAST_CURVES = {
-    "photographic_preserved": {
-        "name": "Photographic Preserved",
-        "description": "Full tonal range from source image maintained — watercolor as overlay not replacement",
-        "toe_compression": 0.05,
-        "shoulder_rolloff": 0.05,
-        "midtone_contrast": 0.50,
-        "visual_effect": "Source dynamic range visible through watercolor treatment",
-    },
-    "lifted_wash": {
-        "name": "Lifted Wash",
-        "description": "Raised black point — deepest darks replaced by paper-tone darks. Classic watercolor luminosity.",
-        "toe_compression": 0.35,
-        "shoulder_rolloff": 0.15,
-        "midtone_contrast": 0.30,
-        "visual_effect": "Luminous shadows where paper glows through thin pigment",
-    },
-    "high_key_dissolution": {
-        "name": "High Key Dissolution",
-        "description": "Majority of tonal range compressed into upper values. Content dissolves into light.",
-        "toe_compression": 0.50,
-        "shoulder_rolloff": 0.10,
-        "midtone_contrast": 0.20,
-        "visual_effect": "Content fading into paper white — dissolution as overexposure",
-    },
-    "anchor_contrast": {
-        "name": "Anchor Contrast",
-        "description": "Bimodal — strong contrast in anchor elements, flat in dissolution zones. Two tonal regimes coexisting.",
-        "toe_compression": 0.10,
-        "shoulder_rolloff": 0.10,
-        "midtone_contrast": 0.65,
-        "visual_effect": "Sharp photographic anchors punching through soft watercolor fields",
-    },
-    "granulation_curve": {
-        "name": "Granulation Curve",
-        "description": "Exaggerated midtone separation revealing pigment particle behavior. Shadows and highlights compressed.",
-        "toe_compression": 0.25,
-        "shoulder_rolloff": 0.25,
-        "midtone_contrast": 0.70,
-        "visual_effect": "Visible pigment granulation in midtones, compressed extremes",
-    },
-    "flood_flat": {
-        "name": "Flood Flat",
-        "description": "Minimal contrast — color fields at similar value. Chromaticity carries the composition instead of luminance.",
-        "toe_compression": 0.40,
-        "shoulder_rolloff": 0.40,
-        "midtone_contrast": 0.15,
-        "visual_effect": "Flat color fields where hue difference replaces value contrast",
-    },
+CONTRAST_CURVES = MappingProxyType({
+    "photographic_preserved": ContrastCurve(
+        name="Photographic Preserved",
+        description="Full tonal range from source image maintained — watercolor as overlay not replacement",
+        toe_compression=0.05,
+        shoulder_rolloff=0.05,
+        midtone_contrast=0.50,
+        visual_effect="Source dynamic range visible through watercolor treatment",
+    ),
+    "lifted_wash": ContrastCurve(
+        name="Lifted Wash",
+        description="Raised black point — deepest darks replaced by paper-tone darks. Classic watercolor luminosity.",
+        toe_compression=0.35,
+        shoulder_rolloff=0.15,
+        midtone_contrast=0.30,
+        visual_effect="Luminous shadows where paper glows through thin pigment",
+    ),
+    "high_key_dissolution": ContrastCurve(
+        name="High Key Dissolution",
+        description="Majority of tonal range compressed into upper values. Content dissolves into light.",
+        toe_compression=0.50,
+        shoulder_rolloff=0.10,
+        midtone_contrast=0.20,
+        visual_effect="Content fading into paper white — dissolution as overexposure",
+    ),
+    "anchor_contrast": ContrastCurve(
+        name="Anchor Contrast",
+        description="Bimodal — strong contrast in anchor elements, flat in dissolution zones. Two tonal regimes coexisting.",
+        toe_compression=0.10,
+        shoulder_rolloff=0.10,
+        midtone_contrast=0.65,
+        visual_effect="Sharp photographic anchors punching through soft watercolor fields",
+    ),
+    "granulation_curve": ContrastCurve(
+        name="Granulation Curve",
+        description="Exaggerated midtone separation revealing pigment particle behavior. Shadows and highlights compressed.",
+        toe_compression=0.25,
+        shoulder_rolloff=0.25,
+        midtone_contrast=0.70,
+        visual_effect="Visible pigment granulation in midtones, compressed extremes",
+    ),
+    "flood_flat": ContrastCurve(
+        name="Flood Flat",
+        description="Minimal contrast — color fields at similar value. Chromaticity carries the composition instead of luminance.",
+        toe_compression=0.40,
+        shoulder_rolloff=0.40,
+        midtone_contrast=0.15,
+        visual_effect="Flat color fields where hue difference replaces value contrast",
+    ),
+})
+
+
+# The Layer 2 hot path (nearest type, vocabulary weights) is interpreter-
+# bound, not compute- or memory-bound: every center in the domain fits in a
+# few hundred bytes. Speed comes from removing Python work — dict walks,
+# call frames, allocations — so the math runs on these packed tables.
+#
+# Visual type centers packed once into fixed-order tuples (PARAMETER_NAMES
+# order) so nearest-type and vocabulary lookups never walk the nested dicts.
+_TYPE_IDS = tuple(VISUAL_TYPES)
+_TYPE_CENTERS = tuple(
+    tuple(VISUAL_TYPES[tid]["center"][k] for k in PARAMETER_NAMES)
+    for tid in _TYPE_IDS
+)
+
+# Packed coordinates for every addressable state id. The dict forms stay
+# for the JSON API; these are what the distance math touches.
+_TYPE_COORDS = dict(zip(_TYPE_IDS, _TYPE_CENTERS))
+_CANONICAL_COORDS = {
+    sid: tuple(s["coordinates"][k] for k in PARAMETER_NAMES)
+    for sid, s in CANONICAL_STATES.items()
+}
+_ATTRACTOR_COORDS = {
+    pid: tuple(p["state"][k] for k in PARAMETER_NAMES)
+    for pid, p in ATTRACTOR_PRESETS.items()
 }
+# Single id → coordinates table; merge order encodes the resolution
+# precedence canonical state → visual type → attractor preset.
+_STATE_COORDS = {**_ATTRACTOR_COORDS, **_TYPE_COORDS, **_CANONICAL_COORDS}
+
+# Per-type (edge, substrate, hydrology) descriptors for vocabulary blending.
+# They depend only on each type's fixed center, so they are formatted once.
+_TYPE_DESCRIPTORS = {}
+for _tid, _t in VISUAL_TYPES.items():
+    _c = _t["center"]
+    if _c["edge_coherence"] > 0.7:
+        _edge = f"architectural hard edges from {_t['name']} regime"
+    elif _c["edge_coherence"] > 0.4:
+        _edge = f"mixed edge negotiation from {_t['name']} regime"
+    else:
+        _edge = f"feathered bleed edges from {_t['name']} regime"
+    if _c["substrate_visibility"] > 0.7:
+        _substrate = f"paper dominant — {_t['name']} aesthetic"
+    elif _c["substrate_visibility"] > 0.3:
+        _substrate = f"paper partially visible — {_t['name']} zone"
+    else:
+        _substrate = f"substrate hidden — {_t['name']} coverage"
+    if _c["pigment_hydrology"] > 0.7:
+        _hydrology = f"wet flooding behavior from {_t['name']}"
+    elif _c["pigment_hydrology"] > 0.3:
+        _hydrology = f"controlled wash from {_t['name']}"
+    else:
+        _hydrology = f"dry technique from {_t['name']}"
+    _TYPE_DESCRIPTORS[_tid] = (_edge, _substrate, _hydrology)
+del _tid, _t, _c, _edge, _substrate, _hydrology
 
 
 # ─────────────────────────────────────────────────────────────────────
 # UTILITY FUNCTIONS
 # ─────────────────────────────────────────────────────────────────────
 
-def _euclidean_distance(a: dict, b: dict) -> float:
-    """Euclidean distance between two states in 5D parameter space."""
-    return math.sqrt(sum((a[k] - b[k]) ** 2 for k in PARAMETER_NAMES))
+def _records_json(records) -> dict:
+    """Expand a mapping of NamedTuple records into plain dicts for JSON."""
+    return {rid: r._asdict() for rid, r in records.items()}
+
+
+def _dumps(obj, pretty: bool = True) -> str:
+    """Serialize a tool response, using orjson when it is installed.
+
+    Output is indented only if both pretty and _PRETTY are set."""
+    pretty = pretty and _PRETTY
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0).decode()
+    if pretty:
+        return json.dumps(obj, indent=2)
+    # Same compact bytes as orjson: no whitespace, non-ASCII left unescaped
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+
+def _euclidean_distance(a: tuple, b: tuple) -> float:
+    """Euclidean distance between two packed states in 5D parameter space."""
+    d0 = a[0] - b[0]
+    d1 = a[1] - b[1]
+    d2 = a[2] - b[2]
+    d3 = a[3] - b[3]
+    d4 = a[4] - b[4]
+    # ** 2 and sum() on purpose: pow() need not round like d * d, and sum()
+    # is compensated from 3.12, so a d * d + chain can shift the last ulp
+    return math.sqrt(sum((d0 ** 2, d1 ** 2, d2 ** 2, d3 ** 2, d4 ** 2)))
+
+
+def _state_vec(state: dict) -> tuple:
+    """Pack a state dict into a fixed-order tuple (PARAMETER_NAMES order).
+
+    + 0.0 turns -0.0 into 0.0: the memoized helpers key on these tuples,
+    where 0.0 == -0.0, so a signed zero must not reach their formatting."""
+    return (
+        state[_K0] + 0.0,
+        state[_K1] + 0.0,
+        state[_K2] + 0.0,
+        state[_K3] + 0.0,
+        state[_K4] + 0.0,
+    )
+
+
+def _state_tuple(state_id: str) -> Optional[tuple]:
+    """Packed coordinates for a state id (None if unknown).
 
+    Ids resolve canonical state → visual type → attractor preset."""
+    return _STATE_COORDS.get(state_id)
 
-def _lerp_state(a: dict, b: dict, t: float) -> dict:
-    """Linear interpolation between two states at parameter t ∈ [0, 1]."""
-    return {k: a[k] + t * (b[k] - a[k]) for k in PARAMETER_NAMES}
 
+def _type_sq_distances(v: tuple) -> list:
+    """Squared distances from a packed state to every visual type center (_TYPE_IDS order)."""
+    v0, v1, v2, v3, v4 = v
+    out = []
+    for c0, c1, c2, c3, c4 in _TYPE_CENTERS:
+        d0 = v0 - c0
+        d1 = v1 - c1
+        d2 = v2 - c2
+        d3 = v3 - c3
+        d4 = v4 - c4
+        # Same arithmetic as _euclidean_distance (** 2 and sum()), so the
+        # nearest-type picks agree with it on every supported Python
+        out.append(sum((d0 ** 2, d1 ** 2, d2 ** 2, d3 ** 2, d4 ** 2)))
+    return out
 
-def _nearest_visual_type(state: dict) -> tuple[str, float]:
-    """Find nearest visual type to a given state. Returns (type_id, distance)."""
+
+def _round_state(v: tuple) -> dict:
+    """Packed state → response dict keyed by PARAMETER_NAMES, rounded to 4 places."""
+    return {
+        _K0: round(v[0], 4),
+        _K1: round(v[1], 4),
+        _K2: round(v[2], 4),
+        _K3: round(v[3], 4),
+        _K4: round(v[4], 4),
+    }
+
+
+def _lerp_vecs(a: tuple, b: tuple, ts: list) -> list:
+    """Packed states along the segment a → b, one per t in ts."""
+    a0, a1, a2, a3, a4 = a
+    d0, d1, d2, d3, d4 = b[0] - a0, b[1] - a1, b[2] - a2, b[3] - a3, b[4] - a4
+    return [
+        (a0 + t * d0, a1 + t * d1, a2 + t * d2, a3 + t * d3, a4 + t * d4)
+        for t in ts
+    ]
+
+
+@lru_cache(maxsize=1024)
+def _nearest_vec(v: tuple) -> tuple[str, float]:
+    """Nearest visual type to a packed state, memoized on the exact coordinates."""
+    # Argmin over the rooted distances, not d2: two squared distances a few
+    # ulps apart can round to the same sqrt, and that tie must go to the
+    # first type in _TYPE_IDS order (as in _vocabulary_for_vec)
     best_id = ""
     best_dist = float("inf")
-    for tid, tdata in VISUAL_TYPES.items():
-        d = _euclidean_distance(state, tdata["center"])
+    for tid, d2 in zip(_TYPE_IDS, _type_sq_distances(v)):
+        d = math.sqrt(d2)
         if d < best_dist:
             best_dist = d
             best_id = tid
     return best_id, best_dist
 
 
-def _softmax(scores: dict, temperature: float = 1.0) -> dict:
-    """Softmax over a dict of scores."""
-    max_s = max(scores.values()) if scores else 0
-    exp_s = {k: math.exp((v - max_s) / temperature) for k, v in scores.items()}
-    total = sum(exp_s.values())
-    return {k: v / total for k, v in exp_s.items()} if total > 0 else exp_s
+def _softmax_values(values: list, temperature: float = 1.0) -> list:
+    """Softmax over a list of scores. Returns weights in the same order."""
+    max_s = max(values) if values else 0
+    exp_v = [math.exp((v - max_s) / temperature) for v in values]
+    total = sum(exp_v)
+    return [e / total for e in exp_v] if total > 0 else exp_v
 
 
 def _interpolate_vocabulary(state: dict, strength: float = 1.0) -> dict:
     """Interpolate visual vocabulary from visual type proximities."""
-    distances = {}
-    for tid, tdata in VISUAL_TYPES.items():
-        distances[tid] = _euclidean_distance(state, tdata["center"])
+    nearest_id, nearest_dist, categories = _vocabulary_for_vec(_state_vec(state))
+    nearest = VISUAL_TYPES[nearest_id]
+    return {
+        "nearest_visual_type": nearest_id,
+        "distance": nearest_dist,
+        "keywords": nearest["keywords"],
+        "optical_properties": nearest["optical"],
+        "color_associations": nearest["color_associations"],
+        "nearest_canonical_state": nearest_id,
+        "canonical_distance": nearest_dist,
+        "vocabulary_by_category": {cat: list(descs) for cat, descs in categories},
+        "strength": strength,
+        "input_state": state,
+    }
 
-    # Convert distances to similarity scores (inverse distance)
-    scores = {tid: 1.0 / (d + 0.01) for tid, d in distances.items()}
-    weights = _softmax(scores, temperature=0.5)
 
-    # Collect weighted vocabulary
-    nearest_id = min(distances, key=distances.get)
-    nearest = VISUAL_TYPES[nearest_id]
+@lru_cache(maxsize=1024)
+def _vocabulary_for_vec(v: tuple) -> tuple:
+    """State-dependent core of _interpolate_vocabulary, memoized on the packed state.
+
+    Returns (nearest_id, nearest_dist, categories) with categories as
+    immutable (name, descriptors) pairs, since the result is shared."""
+    # One pass over the squared distances: true distance (the softmax is
+    # shaped on it, so all six need the sqrt), inverse-distance similarity
+    # score, and the running argmin on the rooted distance (first type wins
+    # ties, exactly as _nearest_vec picks)
+    scores = []
+    nearest_idx = 0
+    nearest_dist = float("inf")
+    for i, d2 in enumerate(_type_sq_distances(v)):
+        d = math.sqrt(d2)
+        scores.append(1.0 / (d + 0.01))
+        if d < nearest_dist:
+            nearest_idx = i
+            nearest_dist = d
+    nearest_id = _TYPE_IDS[nearest_idx]
+
+    # Softmax (temperature 0.5), kept as a list aligned with _TYPE_IDS
+    weights = _softmax_values(scores, temperature=0.5)
 
     # Blend keywords from top contributing types
-    contributing = sorted(weights.items(), key=lambda x: -x[1])[:3]
+    contributing = nlargest(3, zip(_TYPE_IDS, weights), key=itemgetter(1))
 
     shadow_descriptors = []
     highlight_descriptors = []
@@ -712,105 +955,95 @@ def _interpolate_vocabulary(state: dict, strength: float = 1.0) -> dict:
     hydrology_descriptors = []
 
     for tid, w in contributing:
-        t = VISUAL_TYPES[tid]
-        c = t["center"]
         if w > 0.1:
-            # Edge character
-            if c["edge_coherence"] > 0.7:
-                edge_descriptors.append(f"architectural hard edges from {t['name']} regime")
-            elif c["edge_coherence"] > 0.4:
-                edge_descriptors.append(f"mixed edge negotiation from {t['name']} regime")
-            else:
-                edge_descriptors.append(f"feathered bleed edges from {t['name']} regime")
-
-            # Substrate character
-            if c["substrate_visibility"] > 0.7:
-                substrate_descriptors.append(f"paper dominant — {t['name']} aesthetic")
-            elif c["substrate_visibility"] > 0.3:
-                substrate_descriptors.append(f"paper partially visible — {t['name']} zone")
-            else:
-                substrate_descriptors.append(f"substrate hidden — {t['name']} coverage")
-
-            # Hydrology character
-            if c["pigment_hydrology"] > 0.7:
-                hydrology_descriptors.append(f"wet flooding behavior from {t['name']}")
-            elif c["pigment_hydrology"] > 0.3:
-                hydrology_descriptors.append(f"controlled wash from {t['name']}")
-            else:
-                hydrology_descriptors.append(f"dry technique from {t['name']}")
-
-    return {
-        "nearest_visual_type": nearest_id,
-        "distance": distances[nearest_id],
-        "keywords": nearest["keywords"],
-        "optical_properties": nearest["optical"],
-        "color_associations": nearest["color_associations"],
-        "nearest_canonical_state": nearest_id,
-        "canonical_distance": distances[nearest_id],
-        "vocabulary_by_category": {
-            "dissolution_character": [
-                f"dissolution rate at {state['dissolution_rate']:.0%} — "
-                + ("photographic dominant" if state["dissolution_rate"] < 0.3
-                   else "mid-dissolution tension" if state["dissolution_rate"] < 0.6
-                   else "painterly dominant"),
-            ],
-            "edge_character": edge_descriptors[:3] if edge_descriptors else ["balanced edge mix"],
-            "substrate_character": substrate_descriptors[:3] if substrate_descriptors else ["moderate paper visibility"],
-            "hydrology_character": hydrology_descriptors[:3] if hydrology_descriptors else ["controlled wash behavior"],
-            "anchor_character": [
-                f"anchor density at {state['anchor_density']:.0%} — "
-                + ("dense photographic anchors throughout" if state["anchor_density"] > 0.7
-                   else "scattered fidelity anchors" if state["anchor_density"] > 0.3
-                   else "minimal anchoring — near-abstract")
-            ],
-        },
-        "strength": strength,
-        "input_state": state,
-    }
+            edge, substrate, hydrology = _TYPE_DESCRIPTORS[tid]
+            edge_descriptors.append(edge)
+            substrate_descriptors.append(substrate)
+            hydrology_descriptors.append(hydrology)
+
+    dissolution_rate = v[0]
+    anchor_density = v[4]
+    categories = (
+        ("dissolution_character", (
+            f"dissolution rate at {dissolution_rate:.0%} — "
+            + ("photographic dominant" if dissolution_rate < 0.3
+               else "mid-dissolution tension" if dissolution_rate < 0.6
+               else "painterly dominant"),
+        )),
+        ("edge_character", tuple(edge_descriptors[:3]) if edge_descriptors else ("balanced edge mix",)),
+        ("substrate_character", tuple(substrate_descriptors[:3]) if substrate_descriptors else ("moderate paper visibility",)),
+        ("hydrology_character", tuple(hydrology_descriptors[:3]) if hydrology_descriptors else ("controlled wash behavior",)),
+        ("anchor_character", (
+            f"anchor density at {anchor_density:.0%} — "
+            + ("dense photographic anchors throughout" if anchor_density > 0.7
+               else "scattered fidelity anchors" if anchor_density > 0.3
+               else "minimal anchoring — near-abstract"),
+        )),
+    )
+    return nearest_id, nearest_dist, categories
 
 
 # ─────────────────────────────────────────────────────────────────────
 # LAYER 1 TOOLS — Pure taxonomy retrieval (0 LLM tokens)
 # ─────────────────────────────────────────────────────────────────────
 
+# Layer 1 payloads never change after import, so each is serialized once
+# here and the tools hand back the cached text.
+_SERVER_INFO_JSON = _dumps({
+    "name": "Watercolor Dissolution Aesthetics",
+    "version": "1.0.0",
+    "domain": "watercolor_dissolution",
+    "description": (
+        "Medium transformation domain mapping photographic fidelity to "
+        "painterly abstraction through watercolor-specific dissolution behaviors. "
+        "A process domain (like film_color_grading) rather than a subject domain — "
+        "it describes HOW one visual regime dissolves into another."
+    ),
+    "parameter_space": {
+        "dimensions": 5,
+        "axes": {
+            "dissolution_rate": "0.0 (photographic) → 1.0 (painterly abstraction)",
+            "edge_coherence": "0.0 (feathered/bled) → 1.0 (architecturally sharp)",
+            "substrate_visibility": "0.0 (paper hidden) → 1.0 (paper dominant)",
+            "pigment_hydrology": "0.0 (dry brush) → 1.0 (flooding wet-on-wet)",
+            "anchor_density": "0.0 (pure abstraction) → 1.0 (dense photographic anchors)",
+        },
+    },
+    "visual_types": 6,
+    "canonical_states": 10,
+    "edge_modes": 6,
+    "hydrology_states": 5,
+    "substrate_types": 5,
+    "rhythmic_presets": 5,
+    "attractor_presets": 7,
+    "color_harmony_modes": 5,
+    "contrast_curves": 6,
+    "layer_architecture": {
+        "layer_1": "Pure taxonomy retrieval (0 tokens)",
+        "layer_2": "Deterministic computation (0 tokens)",
+        "layer_3": "Claude synthesis interface",
+    },
+})
+
+
 @mcp.tool()
 def get_server_info() -> str:
     """Get information about the Watercolor Dissolution MCP server."""
-    return json.dumps({
-        "name": "Watercolor Dissolution Aesthetics",
-        "version": "1.0.0",
-        "domain": "watercolor_dissolution",
-        "description": (
-            "Medium transformation domain mapping photographic fidelity to "
-            "painterly abstraction through watercolor-specific dissolution behaviors. "
-            "A process domain (like film_color_grading) rather than a subject domain — "
-            "it describes HOW one visual regime dissolves into another."
-        ),
-        "parameter_space": {
-            "dimensions": 5,
-            "axes": {
-                "dissolution_rate": "0.0 (photographic) → 1.0 (painterly abstraction)",
-                "edge_coherence": "0.0 (feathered/bled) → 1.0 (architecturally sharp)",
-                "substrate_visibility": "0.0 (paper hidden) → 1.0 (paper dominant)",
-                "pigment_hydrology": "0.0 (dry brush) → 1.0 (flooding wet-on-wet)",
-                "anchor_density": "0.0 (pure abstraction) → 1.0 (dense photographic anchors)",
-            },
-        },
-        "visual_types": 6,
-        "canonical_states": 10,
-        "edge_modes": 6,
-        "hydrology_states": 5,
-        "substrate_types": 5,
-        "rhythmic_presets": 5,
-        "attractor_presets": 7,
-        "color_harmony_modes": 5,
-        "contrast_curves": 6,
-        "layer_architecture": {
-            "layer_1": "Pure taxonomy retrieval (0 tokens)",
-            "layer_2": "Deterministic computation (0 tokens)",
-            "layer_3": "Claude synthesis interface",
-        },
-    }, indent=2)
+    return _SERVER_INFO_JSON
+
+
+_STYLES_JSON = _dumps({
+    "styles": [
+        {
+            "id": tid,
+            "name": t["name"],
+            "description": t["description"][:120] + "...",
+            "center": t["center"],
+        }
+        for tid, t in VISUAL_TYPES.items()
+    ],
+    "count": len(VISUAL_TYPES),
+})
 
 
 @mcp.tool()
@@ -821,15 +1054,10 @@ def list_dissolution_styles() -> str:
 
     Returns overview of: Editorial Wash, Contested Boundary, Full Dissolution,
     Ghost Impression, Substrate Emergence, Chromatic Flood."""
-    styles = []
-    for tid, t in VISUAL_TYPES.items():
-        styles.append({
-            "id": tid,
-            "name": t["name"],
-            "description": t["description"][:120] + "...",
-            "center": t["center"],
-        })
-    return json.dumps({"styles": styles, "count": len(styles)}, indent=2)
+    return _STYLES_JSON
+
+
+_STYLE_DETAILS_JSON = {tid: _dumps(t) for tid, t in VISUAL_TYPES.items()}
 
 
 @mcp.tool()
@@ -841,30 +1069,43 @@ def get_dissolution_style_details(style_id: str) -> str:
     Args:
         style_id: One of: editorial_wash, contested_boundary, full_dissolution,
                   ghost_impression, substrate_emergence, chromatic_flood"""
-    if style_id not in VISUAL_TYPES:
-        return json.dumps({"error": f"Unknown style: {style_id}", "valid": list(VISUAL_TYPES.keys())})
-    return json.dumps(VISUAL_TYPES[style_id], indent=2)
+    details = _STYLE_DETAILS_JSON.get(style_id)
+    if details is None:
+        return _dumps({"error": f"Unknown style: {style_id}", "valid": list(VISUAL_TYPES.keys())}, pretty=False)
+    return details
 
 
-@mcp.tool()
-def get_dissolution_visual_types() -> str:
-    """List all 6 dissolution visual types with keywords and optical properties. Layer 1 (0 tokens)."""
-    types = {}
-    for tid, t in VISUAL_TYPES.items():
-        types[tid] = {
+_VISUAL_TYPES_JSON = _dumps({
+    "visual_types": {
+        tid: {
             "name": t["name"],
             "center": t["center"],
             "keywords": t["keywords"][:4],
             "optical": t["optical"],
             "color_associations": t["color_associations"],
         }
-    return json.dumps({"visual_types": types, "parameter_names": PARAMETER_NAMES}, indent=2)
+        for tid, t in VISUAL_TYPES.items()
+    },
+    "parameter_names": PARAMETER_NAMES,
+})
+
+
+@mcp.tool()
+def get_dissolution_visual_types() -> str:
+    """List all 6 dissolution visual types with keywords and optical properties. Layer 1 (0 tokens)."""
+    return _VISUAL_TYPES_JSON
+
+
+_CANONICAL_STATES_JSON = _dumps({"canonical_states": dict(CANONICAL_STATES), "count": len(CANONICAL_STATES)})
 
 
 @mcp.tool()
 def get_dissolution_canonical_states() -> str:
     """List all 10 canonical dissolution states with 5D coordinates. Layer 1 (0 tokens)."""
-    return json.dumps({"canonical_states": CANONICAL_STATES, "count": len(CANONICAL_STATES)}, indent=2)
+    return _CANONICAL_STATES_JSON
+
+
+_EDGE_MODES_JSON = _dumps({"edge_modes": _records_json(EDGE_MODES), "count": len(EDGE_MODES)})
 
 
 @mcp.tool()
@@ -873,31 +1114,46 @@ def list_edge_modes() -> str:
 
     Edge modes: architectural_hard, cauliflower_backrun, feathered_bleed,
     silhouette_cut, granulation_boundary, wet_lift."""
-    return json.dumps({"edge_modes": EDGE_MODES, "count": len(EDGE_MODES)}, indent=2)
+    return _EDGE_MODES_JSON
+
+
+_HYDROLOGY_STATES_JSON = _dumps({"hydrology_states": _records_json(HYDROLOGY_STATES), "count": len(HYDROLOGY_STATES)})
 
 
 @mcp.tool()
 def list_hydrology_states() -> str:
     """List all 5 pigment hydrology states from dry brush to flooding. Layer 1 (0 tokens)."""
-    return json.dumps({"hydrology_states": HYDROLOGY_STATES, "count": len(HYDROLOGY_STATES)}, indent=2)
+    return _HYDROLOGY_STATES_JSON
+
+
+_SUBSTRATE_TYPES_JSON = _dumps({"substrate_types": _records_json(SUBSTRATE_TYPES), "count": len(SUBSTRATE_TYPES)})
 
 
 @mcp.tool()
 def list_substrate_types() -> str:
     """List all 5 watercolor substrate types with texture properties. Layer 1 (0 tokens)."""
-    return json.dumps({"substrate_types": SUBSTRATE_TYPES, "count": len(SUBSTRATE_TYPES)}, indent=2)
+    return _SUBSTRATE_TYPES_JSON
+
+
+_COLOR_HARMONY_MODES_JSON = _dumps({"color_harmony_modes": dict(COLOR_HARMONY_MODES), "count": len(COLOR_HARMONY_MODES)})
 
 
 @mcp.tool()
 def list_color_harmony_modes() -> str:
     """List all 5 color harmony modes for dissolution treatments. Layer 1 (0 tokens)."""
-    return json.dumps({"color_harmony_modes": COLOR_HARMONY_MODES, "count": len(COLOR_HARMONY_MODES)}, indent=2)
+    return _COLOR_HARMONY_MODES_JSON
+
+
+_CONTRAST_CURVES_JSON = _dumps({"contrast_curves": _records_json(CONTRAST_CURVES), "count": len(CONTRAST_CURVES)})
 
 
 @mcp.tool()
 def list_contrast_curves() -> str:
     """List all 6 contrast curve types for dissolution treatments. Layer 1 (0 tokens)."""
-    return json.dumps({"contrast_curves": CONTRAST_CURVES, "count": len(CONTRAST_CURVES)}, indent=2)
+    return _CONTRAST_CURVES_JSON
+
+
+_RHYTHMIC_PRESETS_JSON = _dumps({"rhythmic_presets": dict(RHYTHMIC_PRESETS), "count": len(RHYTHMIC_PRESETS)})
 
 
 @mcp.tool()
@@ -910,99 +1166,200 @@ def list_dissolution_rhythmic_presets() -> str:
         substrate_tide (18):        chromatic_flood ↔ substrate_emergence
         edge_negotiation (22):      editorial_wash ↔ contested_boundary
         dissolution_sweep (24):     editorial_wash ↔ chromatic_flood"""
-    return json.dumps({"rhythmic_presets": RHYTHMIC_PRESETS, "count": len(RHYTHMIC_PRESETS)}, indent=2)
+    return _RHYTHMIC_PRESETS_JSON
 
 
-@mcp.tool()
-def list_dissolution_attractor_presets() -> str:
-    """List all 7 attractor presets for dissolution visualization. Layer 2 (0 tokens)."""
-    presets = {}
-    for pid, p in ATTRACTOR_PRESETS.items():
-        presets[pid] = {
+_ATTRACTOR_PRESETS_JSON = _dumps({
+    "attractor_presets": {
+        pid: {
             "name": p["name"],
             "description": p["description"],
             "state": p["state"],
             "basin_radius": p["basin_radius"],
         }
-    return json.dumps({"attractor_presets": presets, "count": len(presets)}, indent=2)
+        for pid, p in ATTRACTOR_PRESETS.items()
+    },
+    "count": len(ATTRACTOR_PRESETS),
+})
+
+
+@mcp.tool()
+def list_dissolution_attractor_presets() -> str:
+    """List all 7 attractor presets for dissolution visualization. Layer 2 (0 tokens)."""
+    return _ATTRACTOR_PRESETS_JSON
 
 
 # ─────────────────────────────────────────────────────────────────────
 # LAYER 2 TOOLS — Deterministic computation (0 LLM tokens)
 # ─────────────────────────────────────────────────────────────────────
 
-@mcp.tool()
-def classify_dissolution_intent(user_intent: str) -> str:
-    """Classify dissolution intent from user description.
+# Keyword tables for the Layer 2 text matchers, built once at import rather
+# than per call. Each tool tests every distinct term against the text once
+# (_match_terms) and then scores by set membership.
+
+# classify_dissolution_intent — style keywords
+_INTENT_STYLE_TERMS = {
+    "editorial_wash": ["editorial", "magazine", "controlled", "sharp subject", "accent", "selective", "subtle", "restrained"],
+    "contested_boundary": ["tension", "between", "both", "neither", "oscillat", "coexist", "compete", "mural", "boundary", "mix"],
+    "full_dissolution": ["loose", "dissolve", "painterly", "watercolor", "abstract", "bloom", "backrun", "complete"],
+    "ghost_impression": ["ghost", "faded", "blueprint", "trace", "skeleton", "palimpsest", "bleach", "dry", "crisp edge"],
+    "substrate_emergence": ["paper", "white space", "negative", "minimal", "restraint", "breath", "ma ", "sparse", "empty"],
+    "chromatic_flood": ["flood", "saturated", "wet", "drip", "pour", "expressionist", "bold", "vivid", "maximum", "intense"],
+}
 
-    LAYER 2: Deterministic keyword matching (0 LLM tokens).
+# classify_dissolution_intent — hydrology keywords (last matching state wins)
+_INTENT_HYDROLOGY_TERMS = {
+    "dry": ["dry brush", "dry", "textured", "broken", "scratchy"],
+    "controlled": ["controlled", "even", "smooth", "balanced", "standard"],
+    "wet_on_dry": ["layered", "crisp layer", "hard edge layer", "glazing"],
+    "wet_on_wet": ["wet on wet", "diffuse", "merge", "soft edge", "bloom"],
+    "flooding": ["flood", "drip", "gravity", "pour", "capillary", "run"],
+}
 
-    Args:
-        user_intent: Description of desired dissolution aesthetic"""
-    text = user_intent.lower()
+# classify_dissolution_intent — substrate keywords (first matching substrate wins)
+_INTENT_SUBSTRATE_TERMS = {
+    "hot_press": ["smooth", "fine detail", "illustration"],
+    "rough": ["rough", "texture", "expressive"],
+    "masa": ["japanese", "sumi", "ink wash"],
+    "yupo": ["experimental", "synthetic", "yupo"],
+}
 
-    # Score each visual type by keyword match
-    type_scores = {}
-    matched_keywords = {}
+_INTENT_VOCABULARY = frozenset(
+    term
+    for table in (_INTENT_STYLE_TERMS, _INTENT_HYDROLOGY_TERMS, _INTENT_SUBSTRATE_TERMS)
+    for terms in table.values()
+    for term in terms
+)
+
+# decompose_dissolution_from_description — keyword fragments (partial matching)
+_DECOMPOSE_FRAGMENTS = {
+    "editorial_wash": [
+        "editorial", "magazine", "controlled", "sharp", "accent",
+        "selective", "restrain", "subtle", "disciplin", "photographic",
+    ],
+    "contested_boundary": [
+        "tension", "between", "neither", "oscillat", "coexist",
+        "compete", "boundary", "unresolved", "both", "mural",
+    ],
+    "full_dissolution": [
+        "dissolv", "loose", "bloom", "backrun", "granulat",
+        "diffus", "abstract", "painterly", "watercolor", "paper texture",
+    ],
+    "ghost_impression": [
+        "ghost", "faded", "blueprint", "palimpsest", "trace",
+        "skeleton", "bleach", "dry", "parchment", "iron-gall",
+    ],
+    "substrate_emergence": [
+        "paper", "white space", "negative space", "minimal",
+        "restraint", "breath", "ma ", "sparse", "empty", "unpaint",
+    ],
+    "chromatic_flood": [
+        "flood", "saturat", "wet-on-wet", "drip", "capillary",
+        "pour", "expressionist", "bold color", "vivid", "chromatic",
+    ],
+}
 
-    # Dissolution keywords
-    dissolution_terms = {
-        "editorial_wash": ["editorial", "magazine", "controlled", "sharp subject", "accent", "selective", "subtle", "restrained"],
-        "contested_boundary": ["tension", "between", "both", "neither", "oscillat", "coexist", "compete", "mural", "boundary", "mix"],
-        "full_dissolution": ["loose", "dissolve", "painterly", "watercolor", "abstract", "bloom", "backrun", "complete"],
-        "ghost_impression": ["ghost", "faded", "blueprint", "trace", "skeleton", "palimpsest", "bleach", "dry", "crisp edge"],
-        "substrate_emergence": ["paper", "white space", "negative", "minimal", "restraint", "breath", "ma ", "sparse", "empty"],
-        "chromatic_flood": ["flood", "saturated", "wet", "drip", "pour", "expressionist", "bold", "vivid", "maximum", "intense"],
-    }
+# decompose_dissolution_from_description — optical terms
+_DECOMPOSE_OPTICAL = {
+    "editorial_wash": ["matte", "opaque", "photographic"],
+    "contested_boundary": ["mixed", "variable", "halation"],
+    "full_dissolution": ["translucent", "diffuse", "paper matte"],
+    "ghost_impression": ["dry matte", "semi transparent", "no scatter"],
+    "substrate_emergence": ["paper dominant", "zero scatter", "ground"],
+    "chromatic_flood": ["wet satin", "maximum scatter", "saturated"],
+}
 
-    # Hydrology keywords
-    hydrology_terms = {
-        "dry": ["dry brush", "dry", "textured", "broken", "scratchy"],
-        "controlled": ["controlled", "even", "smooth", "balanced", "standard"],
-        "wet_on_dry": ["layered", "crisp layer", "hard edge layer", "glazing"],
-        "wet_on_wet": ["wet on wet", "diffuse", "merge", "soft edge", "bloom"],
-        "flooding": ["flood", "drip", "gravity", "pour", "capillary", "run"],
-    }
+# decompose_dissolution_from_description — color terms
+_DECOMPOSE_COLOR = {
+    "editorial_wash": ["neutral", "muted", "editorial"],
+    "contested_boundary": ["warm", "analogous", "amber"],
+    "full_dissolution": ["diluted", "granulation", "paper white"],
+    "ghost_impression": ["faded", "earth", "parchment", "tea"],
+    "substrate_emergence": ["white dominant", "sparse", "chromatic island"],
+    "chromatic_flood": ["saturated", "vivid", "intense", "bright"],
+}
 
-    for tid, terms in dissolution_terms.items():
-        score = 0
-        matches = []
-        for term in terms:
-            if term in text:
-                score += 1
-                matches.append(term)
+_DECOMPOSE_VOCABULARY = frozenset(
+    term
+    for table in (_DECOMPOSE_FRAGMENTS, _DECOMPOSE_OPTICAL, _DECOMPOSE_COLOR)
+    for terms in table.values()
+    for term in terms
+)
+
+
+# Free-form text caches: texts longer than this are computed uncached, so
+# each cache holds at most maxsize entries of bounded size. 1024 entries of
+# ≤1 KiB keys plus a few-KiB payload keep every cache to a few MiB.
+_TEXT_CACHE_MAX_LEN = 1024
+
+
+def _text_lru_cache(maxsize: int):
+    """lru_cache for single-text helpers that bypasses the cache for long text."""
+    def decorate(fn):
+        cached = lru_cache(maxsize=maxsize)(fn)
+
+        @wraps(fn)
+        def wrapper(text: str):
+            if len(text) > _TEXT_CACHE_MAX_LEN:
+                return fn(text)
+            return cached(text)
+
+        wrapper.cache_info = cached.cache_info
+        wrapper.cache_clear = cached.cache_clear
+        return wrapper
+    return decorate
+
+
+def _match_terms(text: str, vocabulary: frozenset) -> set:
+    """Terms from vocabulary that occur in text, testing each distinct term once."""
+    return {term for term in vocabulary if term in text}
+
+
+@_text_lru_cache(maxsize=1024)
+def _classify_intent(text: str) -> dict:
+    """Response payload for classify_dissolution_intent, memoized on the lowercased intent.
+
+    The dict is shared between callers and must not be mutated."""
+    # Score each visual type by keyword match
+    type_scores = {}
+    matched_keywords = {}
+    found = _match_terms(text, _INTENT_VOCABULARY)
+
+    # Track the best-scoring type while scoring (first type wins ties)
+    best_tid = ""
+    best_score = -1
+    for tid, terms in _INTENT_STYLE_TERMS.items():
+        matches = [term for term in terms if term in found]
+        score = len(matches)
         type_scores[tid] = score
         if matches:
             matched_keywords[tid] = matches
+        if score > best_score:
+            best_tid = tid
+            best_score = score
 
     # Determine primary style
-    if max(type_scores.values()) == 0:
+    if best_score == 0:
         primary = "contested_boundary"  # default to mid-range
         confidence = 0.3
     else:
-        primary = max(type_scores, key=type_scores.get)
-        confidence = min(1.0, max(type_scores.values()) / 4.0)
+        primary = best_tid
+        confidence = min(1.0, best_score / 4.0)
 
     # Detect hydrology preference
     hydrology_match = "controlled_wash"
-    for hid, terms in hydrology_terms.items():
-        for term in terms:
-            if term in text:
-                hydrology_match = hid if hid != "dry" else "dry_brush"
-                break
+    for hid, terms in _INTENT_HYDROLOGY_TERMS.items():
+        if any(term in found for term in terms):
+            hydrology_match = hid if hid != "dry" else "dry_brush"
 
     # Detect substrate preference
     substrate_match = "cold_press"
-    if any(t in text for t in ["smooth", "fine detail", "illustration"]):
-        substrate_match = "hot_press"
-    elif any(t in text for t in ["rough", "texture", "expressive"]):
-        substrate_match = "rough"
-    elif any(t in text for t in ["japanese", "sumi", "ink wash"]):
-        substrate_match = "masa"
-    elif any(t in text for t in ["experimental", "synthetic", "yupo"]):
-        substrate_match = "yupo"
-
-    return json.dumps({
+    for sid, terms in _INTENT_SUBSTRATE_TERMS.items():
+        if any(term in found for term in terms):
+            substrate_match = sid
+            break
+
+    return {
         "primary_style": primary,
         "style_details": {
             "name": VISUAL_TYPES[primary]["name"],
@@ -1014,114 +1371,81 @@ def classify_dissolution_intent(user_intent: str) -> str:
         "suggested_hydrology": hydrology_match,
         "suggested_substrate": substrate_match,
         "center": VISUAL_TYPES[primary]["center"],
-    }, indent=2)
+    }
+
+
+@_text_lru_cache(maxsize=1024)
+def _classify_intent_json(text: str) -> str:
+    """Serialized _classify_intent, so repeat tool calls skip the dump as well."""
+    return _dumps(_classify_intent(text))
 
 
 @mcp.tool()
-def decompose_dissolution_from_description(description: str) -> str:
-    """Decompose a text description into 5D dissolution parameter coordinates.
+def classify_dissolution_intent(user_intent: str) -> str:
+    """Classify dissolution intent from user description.
 
     LAYER 2: Deterministic keyword matching (0 LLM tokens).
 
-    Inverse of the generative pipeline. Takes an image description and
-    recovers the watercolor dissolution coordinates by matching against
-    the 6 visual type keyword vocabularies.
-
     Args:
-        description: Image description text (from Claude vision, user text,
-                     or any text describing an aesthetic artifact)."""
-    text = description.lower()
+        user_intent: Description of desired dissolution aesthetic"""
+    return _classify_intent_json(user_intent.lower())
+
+
+@_text_lru_cache(maxsize=1024)
+def _decompose_description(text: str) -> dict:
+    """Response payload for decompose_dissolution_from_description, memoized on the lowercased text.
 
+    The dict is shared between callers and must not be mutated."""
     # Score each visual type
     type_scores = {}
+    total_matches = 0
     matched_fragments = []
 
-    # Keyword fragments to match (partial matching)
-    fragment_map = {
-        "editorial_wash": [
-            "editorial", "magazine", "controlled", "sharp", "accent",
-            "selective", "restrain", "subtle", "disciplin", "photographic",
-        ],
-        "contested_boundary": [
-            "tension", "between", "neither", "oscillat", "coexist",
-            "compete", "boundary", "unresolved", "both", "mural",
-        ],
-        "full_dissolution": [
-            "dissolv", "loose", "bloom", "backrun", "granulat",
-            "diffus", "abstract", "painterly", "watercolor", "paper texture",
-        ],
-        "ghost_impression": [
-            "ghost", "faded", "blueprint", "palimpsest", "trace",
-            "skeleton", "bleach", "dry", "parchment", "iron-gall",
-        ],
-        "substrate_emergence": [
-            "paper", "white space", "negative space", "minimal",
-            "restraint", "breath", "ma ", "sparse", "empty", "unpaint",
-        ],
-        "chromatic_flood": [
-            "flood", "saturat", "wet-on-wet", "drip", "capillary",
-            "pour", "expressionist", "bold color", "vivid", "chromatic",
-        ],
-    }
-
-    # Also match optical/color terms
-    optical_map = {
-        "editorial_wash": ["matte", "opaque", "photographic"],
-        "contested_boundary": ["mixed", "variable", "halation"],
-        "full_dissolution": ["translucent", "diffuse", "paper matte"],
-        "ghost_impression": ["dry matte", "semi transparent", "no scatter"],
-        "substrate_emergence": ["paper dominant", "zero scatter", "ground"],
-        "chromatic_flood": ["wet satin", "maximum scatter", "saturated"],
-    }
-
-    color_map = {
-        "editorial_wash": ["neutral", "muted", "editorial"],
-        "contested_boundary": ["warm", "analogous", "amber"],
-        "full_dissolution": ["diluted", "granulation", "paper white"],
-        "ghost_impression": ["faded", "earth", "parchment", "tea"],
-        "substrate_emergence": ["white dominant", "sparse", "chromatic island"],
-        "chromatic_flood": ["saturated", "vivid", "intense", "bright"],
-    }
+    found = _match_terms(text, _DECOMPOSE_VOCABULARY)
 
     for tid in VISUAL_TYPES:
         score = 0
-        for frag in fragment_map.get(tid, []):
-            if frag in text:
+        for frag in _DECOMPOSE_FRAGMENTS.get(tid, ()):
+            if frag in found:
                 score += 1
                 matched_fragments.append(frag)
-        for frag in optical_map.get(tid, []):
-            if frag in text:
+        for frag in _DECOMPOSE_OPTICAL.get(tid, ()):
+            if frag in found:
                 score += 0.5
                 matched_fragments.append(frag)
-        for frag in color_map.get(tid, []):
-            if frag in text:
+        for frag in _DECOMPOSE_COLOR.get(tid, ()):
+            if frag in found:
                 score += 0.5
                 matched_fragments.append(frag)
         type_scores[tid] = score
-
-    # Softmax to weights
-    weights = _softmax(type_scores, temperature=1.0)
-
-    # Weighted average of centers
-    coordinates = {k: 0.0 for k in PARAMETER_NAMES}
-    for tid, w in weights.items():
-        center = VISUAL_TYPES[tid]["center"]
-        for k in PARAMETER_NAMES:
-            coordinates[k] += w * center[k]
+        total_matches += score
+
+    # Softmax to weights (type_scores is in _TYPE_IDS order)
+    weight_values = _softmax_values(list(type_scores.values()), temperature=1.0)
+    weights = dict(zip(_TYPE_IDS, weight_values))
+
+    # Weighted average of the packed centers
+    x0 = x1 = x2 = x3 = x4 = 0.0
+    for w, (c0, c1, c2, c3, c4) in zip(weight_values, _TYPE_CENTERS):
+        x0 += w * c0
+        x1 += w * c1
+        x2 += w * c2
+        x3 += w * c3
+        x4 += w * c4
+    coordinates = (x0, x1, x2, x3, x4)
 
     # Confidence: how much domain vocabulary is present
-    total_matches = sum(type_scores.values())
     confidence = min(1.0, total_matches / 8.0)
 
-    nearest_id, nearest_dist = _nearest_visual_type(coordinates)
+    nearest_id, nearest_dist = _nearest_vec(coordinates)
 
     # Optical match from nearest type
     optical_match = VISUAL_TYPES[nearest_id]["optical"]
     color_matches = VISUAL_TYPES[nearest_id]["color_associations"]
 
-    return json.dumps({
+    return {
         "domain_id": "watercolor_dissolution",
-        "coordinates": {k: round(v, 4) for k, v in coordinates.items()},
+        "coordinates": _round_state(coordinates),
         "confidence": round(confidence, 4),
         "nearest_type": nearest_id,
         "nearest_type_distance": round(nearest_dist, 4),
@@ -1131,81 +1455,127 @@ def decompose_dissolution_from_description(description: str) -> str:
         "optical_match": optical_match,
         "color_matches": color_matches,
         "detected": total_matches > 0,
-    }, indent=2)
+    }
+
+
+@_text_lru_cache(maxsize=1024)
+def _decompose_description_json(text: str) -> str:
+    """Serialized _decompose_description, so repeat tool calls skip the dump as well."""
+    return _dumps(_decompose_description(text))
 
 
 @mcp.tool()
-def map_dissolution_parameters(
-    style_id: str,
-    intensity: str = "moderate",
-    emphasis: str = "balanced",
-    substrate: Optional[str] = None,
-) -> str:
-    """Map dissolution style to complete visual parameters.
+def decompose_dissolution_from_description(description: str) -> str:
+    """Decompose a text description into 5D dissolution parameter coordinates.
 
-    Layer 2: Deterministic operation (0 tokens).
+    LAYER 2: Deterministic keyword matching (0 LLM tokens).
+
+    Inverse of the generative pipeline. Takes an image description and
+    recovers the watercolor dissolution coordinates by matching against
+    the 6 visual type keyword vocabularies.
 
     Args:
-        style_id: Dissolution style ID
-        intensity: subtle, moderate, or dramatic
-        emphasis: dissolution, edge, substrate, hydrology, or balanced
-        substrate: Optional substrate type to apply"""
-    if style_id not in VISUAL_TYPES:
-        return json.dumps({"error": f"Unknown style: {style_id}", "valid": list(VISUAL_TYPES.keys())})
+        description: Image description text (from Claude vision, user text,
+                     or any text describing an aesthetic artifact)."""
+    return _decompose_description_json(description.lower())
+
+
+def _above(threshold: float) -> float:
+    """Smallest float strictly greater than threshold.
+
+    Used as a bisect_right bin edge so the bin means "> threshold"
+    rather than ">= threshold"."""
+    return math.nextafter(threshold, math.inf)
+
+
+# Hydrology ladder for map_dissolution_parameters: bisect_right over the
+# bin edges picks the first state whose "< edge" test passes
+_HYDROLOGY_BINS = (0.15, 0.35, 0.55, 0.8)
+_HYDROLOGY_LADDER = ("dry_brush", "controlled_wash", "wet_on_dry", "wet_on_wet", "flooding")
 
+_INTENSITY_SCALES = {"subtle": 0.6, "moderate": 1.0, "dramatic": 1.4}
+
+# Per-axis emphasis shifts, packed in PARAMETER_NAMES order
+_NO_SHIFT = (0.0, 0.0, 0.0, 0.0, 0.0)
+_EMPHASIS_SHIFTS = {
+    "dissolution": (0.1, 0.0, 0.0, 0.0, -0.1),
+    "edge": (0.0, 0.15, 0.0, 0.0, 0.0),
+    "substrate": (0.0, 0.0, 0.15, 0.0, 0.0),
+    "hydrology": (0.0, 0.0, 0.0, 0.15, 0.0),
+    "balanced": _NO_SHIFT,
+}
+
+# Characteristic sentences per axis as (axis index, bin edges, messages),
+# one message per bin; None means the axis contributes nothing there
+_CHARACTERISTIC_RULES = (
+    (0, (0.3, 0.6), (
+        "photographic fidelity dominant with watercolor accents",
+        "contested territory between photographic and painterly regimes",
+        "painterly dissolution overriding photographic source",
+    )),
+    (1, (0.3, _above(0.6)), (
+        "all edges softened into feathered bleeds and backruns",
+        None,
+        "sharp architectural edges persisting through dissolution",
+    )),
+    (2, (_above(0.6),), (
+        None,
+        "paper surface breathing through as compositional element",
+    )),
+    (3, (0.2, _above(0.7)), (
+        "dry technique preserving structural marks",
+        None,
+        "wet-on-wet pigment behavior driving visual texture",
+    )),
+    (4, (0.2, _above(0.6)), (
+        "near-abstract with minimal fidelity anchors",
+        None,
+        "dense photographic anchors maintaining recognizability",
+    )),
+)
+
+
+def _map_parameters(style_id: str, intensity: str, emphasis: str, substrate: Optional[str]) -> dict:
+    """Response payload for map_dissolution_parameters; style_id must be a known visual type."""
     t = VISUAL_TYPES[style_id]
-    state = dict(t["center"])
 
     # Intensity scaling
-    intensity_scale = {"subtle": 0.6, "moderate": 1.0, "dramatic": 1.4}.get(intensity, 1.0)
+    intensity_scale = _INTENSITY_SCALES.get(intensity, 1.0)
 
     # Emphasis shifts
-    emphasis_shifts = {
-        "dissolution": {"dissolution_rate": 0.1, "anchor_density": -0.1},
-        "edge": {"edge_coherence": 0.15},
-        "substrate": {"substrate_visibility": 0.15},
-        "hydrology": {"pigment_hydrology": 0.15},
-        "balanced": {},
-    }
-    shifts = emphasis_shifts.get(emphasis, {})
+    shifts = _EMPHASIS_SHIFTS.get(emphasis, _NO_SHIFT)
 
-    # Apply intensity and emphasis
-    midpoint = {k: 0.5 for k in PARAMETER_NAMES}
-    for k in PARAMETER_NAMES:
-        deviation = (state[k] - midpoint[k]) * intensity_scale
-        state[k] = max(0.0, min(1.0, midpoint[k] + deviation + shifts.get(k, 0.0)))
+    # Apply intensity and emphasis: scale each axis's deviation from the
+    # 0.5 midpoint, shift, and clamp to [0, 1]
+    v = tuple(
+        max(0.0, min(1.0, 0.5 + (c - 0.5) * intensity_scale + shift))
+        for c, shift in zip(_TYPE_COORDS[style_id], shifts)
+    )
+    dissolution_rate, edge_coherence, substrate_visibility, pigment_hydrology, anchor_density = v
 
-    nearest_id, nearest_dist = _nearest_visual_type(state)
+    # One memoized pass gives both the nearest type and the blended vocabulary
+    nearest_id, nearest_dist, categories = _vocabulary_for_vec(v)
 
     # Determine appropriate edge modes
     edge_modes = []
-    if state["edge_coherence"] > 0.6:
+    if edge_coherence > 0.6:
         edge_modes.extend(["architectural_hard", "silhouette_cut"])
-    if 0.3 <= state["edge_coherence"] <= 0.7:
+    if 0.3 <= edge_coherence <= 0.7:
         edge_modes.extend(["cauliflower_backrun", "granulation_boundary"])
-    if state["edge_coherence"] < 0.4:
+    if edge_coherence < 0.4:
         edge_modes.extend(["feathered_bleed", "wet_lift"])
 
     # Determine hydrology state
-    if state["pigment_hydrology"] < 0.15:
-        hydrology = "dry_brush"
-    elif state["pigment_hydrology"] < 0.35:
-        hydrology = "controlled_wash"
-    elif state["pigment_hydrology"] < 0.55:
-        hydrology = "wet_on_dry"
-    elif state["pigment_hydrology"] < 0.8:
-        hydrology = "wet_on_wet"
-    else:
-        hydrology = "flooding"
+    hydrology = _HYDROLOGY_LADDER[bisect_right(_HYDROLOGY_BINS, pigment_hydrology)]
 
     # Determine contrast curve
-    if state["anchor_density"] > 0.7:
+    if anchor_density > 0.7:
         contrast = "anchor_contrast"
-    elif state["dissolution_rate"] > 0.8 and state["pigment_hydrology"] > 0.8:
+    elif dissolution_rate > 0.8 and pigment_hydrology > 0.8:
         contrast = "flood_flat"
-    elif state["dissolution_rate"] > 0.6:
+    elif dissolution_rate > 0.6:
         contrast = "high_key_dissolution"
-    elif state["substrate_visibility"] > 0.6:
+    elif substrate_visibility > 0.6:
         contrast = "lifted_wash"
     else:
         contrast = "photographic_preserved"
@@ -1213,57 +1583,67 @@ def map_dissolution_parameters(
     # Substrate
     substrate_data = None
     if substrate and substrate in SUBSTRATE_TYPES:
-        substrate_data = SUBSTRATE_TYPES[substrate]
+        substrate_data = SUBSTRATE_TYPES[substrate]._asdict()
 
     # Build characteristics
     characteristics = []
-    if state["dissolution_rate"] < 0.3:
-        characteristics.append("photographic fidelity dominant with watercolor accents")
-    elif state["dissolution_rate"] < 0.6:
-        characteristics.append("contested territory between photographic and painterly regimes")
-    else:
-        characteristics.append("painterly dissolution overriding photographic source")
-
-    if state["edge_coherence"] > 0.6:
-        characteristics.append("sharp architectural edges persisting through dissolution")
-    elif state["edge_coherence"] < 0.3:
-        characteristics.append("all edges softened into feathered bleeds and backruns")
-
-    if state["substrate_visibility"] > 0.6:
-        characteristics.append("paper surface breathing through as compositional element")
+    for axis, bins, messages in _CHARACTERISTIC_RULES:
+        message = messages[bisect_right(bins, v[axis])]
+        if message is not None:
+            characteristics.append(message)
 
-    if state["pigment_hydrology"] > 0.7:
-        characteristics.append("wet-on-wet pigment behavior driving visual texture")
-    elif state["pigment_hydrology"] < 0.2:
-        characteristics.append("dry technique preserving structural marks")
-
-    if state["anchor_density"] > 0.6:
-        characteristics.append("dense photographic anchors maintaining recognizability")
-    elif state["anchor_density"] < 0.2:
-        characteristics.append("near-abstract with minimal fidelity anchors")
-
-    return json.dumps({
+    return {
         "style_id": style_id,
         "style_name": t["name"],
         "intensity": intensity,
         "emphasis": emphasis,
         "weight": 1.0,
-        "state": {k: round(v, 4) for k, v in state.items()},
+        "state": _round_state(v),
         "nearest_visual_type": nearest_id,
         "visual_distance": round(nearest_dist, 4),
         "active_edge_modes": edge_modes,
-        "edge_mode_details": {eid: EDGE_MODES[eid] for eid in edge_modes},
+        "edge_mode_details": {eid: EDGE_MODES[eid]._asdict() for eid in edge_modes},
         "hydrology_state": hydrology,
-        "hydrology_details": HYDROLOGY_STATES.get(hydrology, {}),
+        "hydrology_details": HYDROLOGY_STATES[hydrology]._asdict(),
         "contrast_curve": contrast,
-        "contrast_curve_details": CONTRAST_CURVES.get(contrast, {}),
+        "contrast_curve_details": CONTRAST_CURVES[contrast]._asdict(),
         "substrate": substrate_data,
         "characteristics": characteristics,
         "optical_properties": t["optical"],
         "keywords": t["keywords"],
         "color_associations": t["color_associations"],
-        "full_vocabulary": _interpolate_vocabulary(state)["vocabulary_by_category"],
-    }, indent=2)
+        "full_vocabulary": {cat: list(descs) for cat, descs in categories},
+    }
+
+
+@mcp.tool()
+def map_dissolution_parameters(
+    style_id: str,
+    intensity: str = "moderate",
+    emphasis: str = "balanced",
+    substrate: Optional[str] = None,
+) -> str:
+    """Map dissolution style to complete visual parameters.
+
+    Layer 2: Deterministic operation (0 tokens).
+
+    Args:
+        style_id: Dissolution style ID
+        intensity: subtle, moderate, or dramatic
+        emphasis: dissolution, edge, substrate, hydrology, or balanced
+        substrate: Optional substrate type to apply"""
+    if style_id not in VISUAL_TYPES:
+        return _dumps({"error": f"Unknown style: {style_id}", "valid": list(VISUAL_TYPES.keys())}, pretty=False)
+    return _dumps(_map_parameters(style_id, intensity, emphasis, substrate))
+
+
+def _vocabulary_coordinates(dissolution_id: str) -> Optional[dict]:
+    """Coordinates for a dissolution_id (canonical state → visual type), None if unknown."""
+    if dissolution_id in CANONICAL_STATES:
+        return CANONICAL_STATES[dissolution_id]["coordinates"]
+    if dissolution_id in VISUAL_TYPES:
+        return VISUAL_TYPES[dissolution_id]["center"]
+    return None
 
 
 @mcp.tool()
@@ -1275,46 +1655,47 @@ def extract_dissolution_visual_vocabulary(
     """Extract visual vocabulary from dissolution parameter coordinates. Layer 2 (0 tokens).
 
     Provide either state (5D coordinates) or dissolution_id (canonical state name)."""
-    if dissolution_id and dissolution_id in CANONICAL_STATES:
-        state = CANONICAL_STATES[dissolution_id]["coordinates"]
-    elif dissolution_id and dissolution_id in VISUAL_TYPES:
-        state = VISUAL_TYPES[dissolution_id]["center"]
+    coordinates = _vocabulary_coordinates(dissolution_id) if dissolution_id else None
+    if coordinates is not None:
+        state = coordinates
     elif state is None:
-        return json.dumps({"error": "Provide either state dict or dissolution_id"})
+        return _dumps({"error": "Provide either state dict or dissolution_id"}, pretty=False)
 
     result = _interpolate_vocabulary(state, strength)
-    return json.dumps(result, indent=2)
+    return _dumps(result)
 
 
 @mcp.tool()
 def compute_dissolution_distance(id_1: str, id_2: str) -> str:
     """Compute distance between two dissolution states in 5D parameter space. Layer 2 (0 tokens)."""
-    def _resolve(sid):
-        if sid in CANONICAL_STATES:
-            return CANONICAL_STATES[sid]["coordinates"]
-        if sid in VISUAL_TYPES:
-            return VISUAL_TYPES[sid]["center"]
-        if sid in ATTRACTOR_PRESETS:
-            return ATTRACTOR_PRESETS[sid]["state"]
-        return None
-
-    s1 = _resolve(id_1)
-    s2 = _resolve(id_2)
-    if s1 is None:
-        return json.dumps({"error": f"Unknown id: {id_1}"})
-    if s2 is None:
-        return json.dumps({"error": f"Unknown id: {id_2}"})
-
-    dist = _euclidean_distance(s1, s2)
-    diff = {k: round(s2[k] - s1[k], 4) for k in PARAMETER_NAMES}
-
-    return json.dumps({
+    v1 = _state_tuple(id_1)
+    v2 = _state_tuple(id_2)
+    if v1 is None:
+        return _dumps({"error": f"Unknown id: {id_1}"}, pretty=False)
+    if v2 is None:
+        return _dumps({"error": f"Unknown id: {id_2}"}, pretty=False)
+
+    dist = _euclidean_distance(v1, v2)
+
+    # Per-axis difference and the axis with the largest magnitude in one
+    # pass (first axis wins ties, as max() would)
+    diff = {}
+    dominant_axis = PARAMETER_NAMES[0]
+    dominant = -1.0
+    for k, x, y in zip(PARAMETER_NAMES, v1, v2):
+        d = round(y - x, 4)
+        diff[k] = d
+        if abs(d) > dominant:
+            dominant = abs(d)
+            dominant_axis = k
+
+    return _dumps({
         "id_1": id_1,
         "id_2": id_2,
         "distance": round(dist, 4),
         "per_axis_difference": diff,
-        "dominant_axis": max(diff, key=lambda k: abs(diff[k])),
-    }, indent=2)
+        "dominant_axis": dominant_axis,
+    })
 
 
 @mcp.tool()
@@ -1324,175 +1705,238 @@ def compute_dissolution_trajectory(
     num_steps: int = 20,
 ) -> str:
     """Compute smooth trajectory between two dissolution states. Layer 2 (0 tokens)."""
-    def _resolve(sid):
-        if sid in CANONICAL_STATES:
-            return CANONICAL_STATES[sid]["coordinates"]
-        if sid in VISUAL_TYPES:
-            return VISUAL_TYPES[sid]["center"]
-        if sid in ATTRACTOR_PRESETS:
-            return ATTRACTOR_PRESETS[sid]["state"]
-        return None
-
-    start = _resolve(start_id)
-    end = _resolve(end_id)
+    start = _state_tuple(start_id)
+    end = _state_tuple(end_id)
     if start is None:
-        return json.dumps({"error": f"Unknown id: {start_id}"})
+        return _dumps({"error": f"Unknown id: {start_id}"}, pretty=False)
     if end is None:
-        return json.dumps({"error": f"Unknown id: {end_id}"})
+        return _dumps({"error": f"Unknown id: {end_id}"}, pretty=False)
+
+    ts = [i / num_steps for i in range(num_steps + 1)]
+    vecs = _lerp_vecs(start, end, ts)
 
     trajectory = []
-    for i in range(num_steps + 1):
-        t = i / num_steps
-        state = _lerp_state(start, end, t)
-        nearest_id, nearest_dist = _nearest_visual_type(state)
+    for i, (t, v, (nearest_id, nearest_dist)) in enumerate(zip(ts, vecs, map(_nearest_vec, vecs))):
         trajectory.append({
             "step": i,
             "t": round(t, 4),
-            "state": {k: round(v, 4) for k, v in state.items()},
+            "state": _round_state(v),
             "nearest_type": nearest_id,
             "type_distance": round(nearest_dist, 4),
         })
 
-    return json.dumps({
+    return _dumps({
         "start_id": start_id,
         "end_id": end_id,
         "num_steps": num_steps,
         "total_distance": round(_euclidean_distance(start, end), 4),
         "trajectory": trajectory,
-    }, indent=2)
+    })
+
+
+# Prompt descriptor ladders for generate_dissolution_attractor_prompt,
+# indexed by bisect_right over the bin edges (see _above)
+_PROMPT_HYDROLOGY = (
+    "dry brush technique with broken textured marks revealing paper grain",
+    "controlled wash with even pigment coverage and predictable edges",
+    "wet-on-dry layered washes with crisp overlap boundaries",
+    "wet-on-wet diffusion with soft bloom formations and pigment migration",
+    "flooding technique with gravity-driven drips, capillary branching, and pigment pooling",
+)
+_PROMPT_EDGE_BINS = (_above(0.4), _above(0.7))
+_PROMPT_EDGE = (
+    "feathered bleed edges and soft wet-lift transitions throughout",
+    "mixed edge types: cauliflower backruns alongside architectural remnants and granulation boundaries",
+    "architectural hard edges and sharp silhouette cuts persisting through dissolution",
+)
+_PROMPT_SUBSTRATE_BINS = (_above(0.35), _above(0.7))
+_PROMPT_SUBSTRATE = (
+    "substrate hidden beneath continuous pigment coverage",
+    "paper partially visible between wash areas, contributing to luminosity",
+    "paper surface as dominant compositional element — white ground breathing through as active negative space",
+)
+_PROMPT_ANCHOR_BINS = (_above(0.3), _above(0.7))
+_PROMPT_ANCHOR = (
+    "minimal anchoring — near-abstract with content surviving only as color memory or vague shape",
+    "scattered fidelity anchors — select objects retaining photographic clarity amid dissolution",
+    "dense photographic anchors — recognizable objects maintaining sharp fidelity throughout",
+)
+
+# Per-type opening and closing prompt sentences for the nearest visual type;
+# they depend only on the type, so the lowercasing, truncation, joins and
+# replaces happen once here
+_PROMPT_TYPE_TEXT = {
+    tid: (
+        f"Digital watercolor treatment in {vt['name'].lower()} mode. "
+        f"{vt['description'][:200]} ",
+        f"Color palette: {', '.join(vt['color_associations'][:3])}. "
+        f"Optical finish: {vt['optical']['finish'].replace('_', ' ')}, "
+        f"{vt['optical']['scatter'].replace('_', ' ')}, "
+        f"{vt['optical']['transparency'].replace('_', ' ')}.",
+    )
+    for tid, vt in VISUAL_TYPES.items()
+}
 
+# Per-type keyframe snippets shared by the attractor sequence mode and
+# generate_dissolution_sequence_prompts: the first two keywords and the
+# first two color associations
+_KEYWORD_PREVIEW = {
+    tid: f"{vt['keywords'][0]}. {vt['keywords'][1]}"
+    for tid, vt in VISUAL_TYPES.items()
+}
+_COLOR_PREVIEW = {
+    tid: ", ".join(vt["color_associations"][:2])
+    for tid, vt in VISUAL_TYPES.items()
+}
 
-@mcp.tool()
-def generate_dissolution_attractor_prompt(
-    attractor_id: str = "",
-    custom_state: Optional[dict] = None,
-    mode: str = "composite",
-    style_modifier: str = "",
-    keyframe_count: int = 4,
-) -> str:
-    """Generate image generation prompt from attractor state or custom coordinates.
 
-    Modes: composite (single blended), split_view (per category), sequence (keyframes).
-    Layer 2: Deterministic prompt synthesis (0 tokens)."""
-    # Resolve state
+def _attractor_state(attractor_id: str, custom_state: Optional[dict]) -> dict:
+    """Resolve the state for generate_dissolution_attractor_prompt.
+
+    custom_state wins; otherwise attractor_id resolves attractor preset →
+    visual type → canonical state, falling back to contested_boundary."""
     if custom_state:
-        state = custom_state
-    elif attractor_id in ATTRACTOR_PRESETS:
-        state = ATTRACTOR_PRESETS[attractor_id]["state"]
-    elif attractor_id in VISUAL_TYPES:
-        state = VISUAL_TYPES[attractor_id]["center"]
-    elif attractor_id in CANONICAL_STATES:
-        state = CANONICAL_STATES[attractor_id]["coordinates"]
-    else:
-        state = VISUAL_TYPES["contested_boundary"]["center"]
+        return custom_state
+    if attractor_id in ATTRACTOR_PRESETS:
+        return ATTRACTOR_PRESETS[attractor_id]["state"]
+    if attractor_id in VISUAL_TYPES:
+        return VISUAL_TYPES[attractor_id]["center"]
+    if attractor_id in CANONICAL_STATES:
+        return CANONICAL_STATES[attractor_id]["coordinates"]
+    return VISUAL_TYPES["contested_boundary"]["center"]
+
+
+@lru_cache(maxsize=1024)
+def _attractor_base_prompt(v: tuple) -> tuple[str, str]:
+    """Nearest type and base prompt (before any style modifier) for a packed state, memoized."""
+    nearest_id = _nearest_vec(v)[0]
+
+    # Descriptors for the hydrology, edge, substrate and anchor axes
+    hydro_desc = _PROMPT_HYDROLOGY[bisect_right(_HYDROLOGY_BINS, v[3])]
+    edge_desc = _PROMPT_EDGE[bisect_right(_PROMPT_EDGE_BINS, v[1])]
+    sub_desc = _PROMPT_SUBSTRATE[bisect_right(_PROMPT_SUBSTRATE_BINS, v[2])]
+    anchor_desc = _PROMPT_ANCHOR[bisect_right(_PROMPT_ANCHOR_BINS, v[4])]
+
+    type_opening, type_closing = _PROMPT_TYPE_TEXT[nearest_id]
+    return nearest_id, "".join((
+        type_opening,
+        f"Pigment behavior: {hydro_desc}. "
+        f"Edge character: {edge_desc}. "
+        f"Substrate: {sub_desc}. "
+        f"Anchoring: {anchor_desc}. ",
+        type_closing,
+    ))
 
-    nearest_id, nearest_dist = _nearest_visual_type(state)
-    vocab = _interpolate_vocabulary(state)
 
-    vt = VISUAL_TYPES[nearest_id]
+@lru_cache(maxsize=1024)
+def _category_views(v: tuple) -> dict:
+    """split_view fragments per vocabulary category for a packed state, memoized.
 
-    # Determine hydrology descriptor
-    if state["pigment_hydrology"] < 0.15:
-        hydro_desc = "dry brush technique with broken textured marks revealing paper grain"
-    elif state["pigment_hydrology"] < 0.35:
-        hydro_desc = "controlled wash with even pigment coverage and predictable edges"
-    elif state["pigment_hydrology"] < 0.55:
-        hydro_desc = "wet-on-dry layered washes with crisp overlap boundaries"
-    elif state["pigment_hydrology"] < 0.8:
-        hydro_desc = "wet-on-wet diffusion with soft bloom formations and pigment migration"
-    else:
-        hydro_desc = "flooding technique with gravity-driven drips, capillary branching, and pigment pooling"
+    The dict is shared between callers and must not be mutated."""
+    _, _, categories = _vocabulary_for_vec(v)
+    return {
+        cat: {"prompt_fragment": "; ".join(descs), "descriptors": list(descs)}
+        for cat, descs in categories
+    }
 
-    # Determine edge descriptor
-    if state["edge_coherence"] > 0.7:
-        edge_desc = "architectural hard edges and sharp silhouette cuts persisting through dissolution"
-    elif state["edge_coherence"] > 0.4:
-        edge_desc = "mixed edge types: cauliflower backruns alongside architectural remnants and granulation boundaries"
-    else:
-        edge_desc = "feathered bleed edges and soft wet-lift transitions throughout"
 
-    # Determine substrate descriptor
-    if state["substrate_visibility"] > 0.7:
-        sub_desc = "paper surface as dominant compositional element — white ground breathing through as active negative space"
-    elif state["substrate_visibility"] > 0.35:
-        sub_desc = "paper partially visible between wash areas, contributing to luminosity"
-    else:
-        sub_desc = "substrate hidden beneath continuous pigment coverage"
+# Every addressable id's prompt and split_view fragments are built at import;
+# only custom states reach the cached builders cold
+for _v in _STATE_COORDS.values():
+    _attractor_base_prompt(_v)
+    _category_views(_v)
+del _v
 
-    # Determine anchor descriptor
-    if state["anchor_density"] > 0.7:
-        anchor_desc = "dense photographic anchors — recognizable objects maintaining sharp fidelity throughout"
-    elif state["anchor_density"] > 0.3:
-        anchor_desc = "scattered fidelity anchors — select objects retaining photographic clarity amid dissolution"
-    else:
-        anchor_desc = "minimal anchoring — near-abstract with content surviving only as color memory or vague shape"
 
-    base_prompt = (
-        f"Digital watercolor treatment in {vt['name'].lower()} mode. "
-        f"{vt['description'][:200]} "
-        f"Pigment behavior: {hydro_desc}. "
-        f"Edge character: {edge_desc}. "
-        f"Substrate: {sub_desc}. "
-        f"Anchoring: {anchor_desc}. "
-        f"Color palette: {', '.join(vt['color_associations'][:3])}. "
-        f"Optical finish: {vt['optical']['finish'].replace('_', ' ')}, "
-        f"{vt['optical']['scatter'].replace('_', ' ')}, "
-        f"{vt['optical']['transparency'].replace('_', ' ')}."
-    )
+_ATTRACTOR_MODES = frozenset(("composite", "split_view", "sequence"))
+
 
+def _attractor_prompt(state: dict, mode: str, style_modifier: str, keyframe_count: int) -> dict:
+    """Response payload for generate_dissolution_attractor_prompt; mode must be in _ATTRACTOR_MODES."""
+    # Everything below works on the packed state; the dict is only echoed back
+    v = _state_vec(state)
+    nearest_id, base_prompt = _attractor_base_prompt(v)
     if style_modifier:
-        base_prompt += f" Style modifier: {style_modifier}."
+        base_prompt = f"{base_prompt} Style modifier: {style_modifier}."
+
+    vt = VISUAL_TYPES[nearest_id]
 
     if mode == "composite":
-        return json.dumps({
+        return {
             "mode": "composite",
             "prompt": base_prompt,
-            "state": {k: round(v, 4) for k, v in state.items()},
+            "state": {k: round(x, 4) for k, x in state.items()},
             "nearest_type": nearest_id,
             "keywords": vt["keywords"],
-        }, indent=2)
+        }
 
     elif mode == "split_view":
-        categories = vocab["vocabulary_by_category"]
-        views = {}
-        for cat, descs in categories.items():
-            views[cat] = {
-                "prompt_fragment": "; ".join(descs),
-                "descriptors": descs,
-            }
-        return json.dumps({
+        return {
             "mode": "split_view",
             "base_prompt": base_prompt,
-            "category_views": views,
-            "state": {k: round(v, 4) for k, v in state.items()},
-        }, indent=2)
+            "category_views": _category_views(v),
+            "state": {k: round(x, 4) for k, x in state.items()},
+        }
 
     elif mode == "sequence":
         # Generate keyframes along trajectory from editorial_wash to current state
-        start = VISUAL_TYPES["editorial_wash"]["center"]
-        keyframes = []
-        for i in range(keyframe_count):
-            t = i / max(1, keyframe_count - 1)
-            kf_state = _lerp_state(start, state, t)
-            kf_nearest, _ = _nearest_visual_type(kf_state)
-            kf_vt = VISUAL_TYPES[kf_nearest]
-            keyframes.append({
+        span = max(1, keyframe_count - 1)
+        ts = [i / span for i in range(keyframe_count)]
+        kf_vecs = _lerp_vecs(_TYPE_COORDS["editorial_wash"], v, ts)
+        keyframes = [
+            {
                 "keyframe": i + 1,
                 "t": round(t, 3),
-                "state": {k: round(v, 4) for k, v in kf_state.items()},
+                "state": _round_state(kf_vec),
                 "nearest_type": kf_nearest,
                 "prompt_fragment": (
-                    f"Keyframe {i+1}: {kf_vt['name']} — "
-                    f"{kf_vt['keywords'][0]}. {kf_vt['keywords'][1]}."
+                    f"Keyframe {i+1}: {VISUAL_TYPES[kf_nearest]['name']} — "
+                    f"{_KEYWORD_PREVIEW[kf_nearest]}."
                 ),
-            })
-        return json.dumps({
+            }
+            for i, (t, kf_vec, (kf_nearest, _)) in enumerate(
+                zip(ts, kf_vecs, map(_nearest_vec, kf_vecs))
+            )
+        ]
+        return {
             "mode": "sequence",
             "keyframe_count": keyframe_count,
             "keyframes": keyframes,
-        }, indent=2)
+        }
 
-    return json.dumps({"error": f"Unknown mode: {mode}"})
+    raise ValueError(f"Unknown mode: {mode}")
+
+
+@mcp.tool()
+def generate_dissolution_attractor_prompt(
+    attractor_id: str = "",
+    custom_state: Optional[dict] = None,
+    mode: str = "composite",
+    style_modifier: str = "",
+    keyframe_count: int = 4,
+) -> str:
+    """Generate image generation prompt from attractor state or custom coordinates.
+
+    Modes: composite (single blended), split_view (per category), sequence (keyframes).
+    Layer 2: Deterministic prompt synthesis (0 tokens)."""
+    if mode not in _ATTRACTOR_MODES:
+        return _dumps({"error": f"Unknown mode: {mode}"}, pretty=False)
+    state = _attractor_state(attractor_id, custom_state)
+    return _dumps(_attractor_prompt(state, mode, style_modifier, keyframe_count))
+
+
+def _oscillation_sequence(a: tuple, b: tuple, steps, ts: list) -> list:
+    """Sampled states between packed endpoints a and b, one entry per (step, t) pair."""
+    vecs = _lerp_vecs(a, b, ts)
+    return [
+        {
+            "step": step,
+            "t": round(t, 4),
+            "state": _round_state(v),
+            "nearest_type": nearest_id,
+        }
+        for step, t, v, (nearest_id, _) in zip(steps, ts, vecs, map(_nearest_vec, vecs))
+    ]
 
 
 @mcp.tool()
@@ -1505,50 +1949,39 @@ def generate_dissolution_rhythmic_sequence(
     phase_offset: float = 0.0,
 ) -> str:
     """Generate custom rhythmic oscillation between any two dissolution states. Layer 2 (0 tokens)."""
-    def _resolve(sid):
-        if sid in CANONICAL_STATES:
-            return CANONICAL_STATES[sid]["coordinates"]
-        if sid in VISUAL_TYPES:
-            return VISUAL_TYPES[sid]["center"]
-        if sid in ATTRACTOR_PRESETS:
-            return ATTRACTOR_PRESETS[sid]["state"]
-        return None
-
-    a = _resolve(state_a_id)
-    b = _resolve(state_b_id)
+    # _STATE_COORDS already applies canonical → visual type → attractor
+    # precedence, so each id resolves with a single lookup
+    a = _state_tuple(state_a_id)
+    b = _state_tuple(state_b_id)
     if a is None:
-        return json.dumps({"error": f"Unknown id: {state_a_id}"})
+        return _dumps({"error": f"Unknown id: {state_a_id}"}, pretty=False)
     if b is None:
-        return json.dumps({"error": f"Unknown id: {state_b_id}"})
+        return _dumps({"error": f"Unknown id: {state_b_id}"}, pretty=False)
 
     total_steps = steps_per_cycle * num_cycles
-    sequence = []
 
-    for step in range(total_steps):
-        phase = (step / steps_per_cycle + phase_offset) * 2 * math.pi
+    # Only every sample_every-th step is emitted, and each waveform is closed
+    # form in the step index, so evaluate just the sampled steps
+    sample_every = max(1, steps_per_cycle // 4)
+    steps = range(0, total_steps, sample_every)
 
-        if oscillation_pattern == "sinusoidal":
-            t = 0.5 * (1.0 + math.sin(phase))
-        elif oscillation_pattern == "triangle":
+    # Oscillator: pick the waveform once, then evaluate it over those steps
+    if oscillation_pattern == "triangle":
+        ts = []
+        for step in steps:
             cycle_pos = (step % steps_per_cycle) / steps_per_cycle
-            t = 2.0 * cycle_pos if cycle_pos < 0.5 else 2.0 * (1.0 - cycle_pos)
-        elif oscillation_pattern == "sawtooth":
-            t = (step % steps_per_cycle) / steps_per_cycle
-        else:
-            t = 0.5 * (1.0 + math.sin(phase))
-
-        state = _lerp_state(a, b, t)
-        nearest_id, _ = _nearest_visual_type(state)
-
-        if step % max(1, steps_per_cycle // 4) == 0:
-            sequence.append({
-                "step": step,
-                "t": round(t, 4),
-                "state": {k: round(v, 4) for k, v in state.items()},
-                "nearest_type": nearest_id,
-            })
-
-    return json.dumps({
+            ts.append(2.0 * cycle_pos if cycle_pos < 0.5 else 2.0 * (1.0 - cycle_pos))
+    elif oscillation_pattern == "sawtooth":
+        ts = [(step % steps_per_cycle) / steps_per_cycle for step in steps]
+    else:  # sinusoidal, and the fallback for unknown patterns
+        ts = [
+            0.5 * (1.0 + math.sin((step / steps_per_cycle + phase_offset) * math.tau))
+            for step in steps
+        ]
+
+    sequence = _oscillation_sequence(a, b, steps, ts)
+
+    return _dumps({
         "state_a": state_a_id,
         "state_b": state_b_id,
         "oscillation_pattern": oscillation_pattern,
@@ -1557,46 +1990,43 @@ def generate_dissolution_rhythmic_sequence(
         "total_steps": total_steps,
         "sampled_keyframes": len(sequence),
         "sequence": sequence,
-    }, indent=2)
+    })
 
 
-@mcp.tool()
-def apply_dissolution_rhythmic_preset(preset_name: str) -> str:
-    """Apply a curated dissolution rhythmic pattern preset. Layer 2 (0 tokens)."""
-    if preset_name not in RHYTHMIC_PRESETS:
-        return json.dumps({"error": f"Unknown preset: {preset_name}", "valid": list(RHYTHMIC_PRESETS.keys())})
-
+def _rhythmic_preset_payload(preset_name: str) -> dict:
+    """Response payload for apply_dissolution_rhythmic_preset (known preset_name)."""
     preset = RHYTHMIC_PRESETS[preset_name]
-    a_id = preset["state_a"]
-    b_id = preset["state_b"]
-
-    a = VISUAL_TYPES[a_id]["center"] if a_id in VISUAL_TYPES else CANONICAL_STATES[a_id]["coordinates"]
-    b = VISUAL_TYPES[b_id]["center"] if b_id in VISUAL_TYPES else CANONICAL_STATES[b_id]["coordinates"]
+    # Same resolver as the rhythmic sequence tool (ids shared by a visual
+    # type and a canonical state carry identical coordinates)
+    a = _state_tuple(preset["state_a"])
+    b = _state_tuple(preset["state_b"])
 
     period = preset["period"]
-    sequence = []
-
-    for step in range(period):
-        phase = (step / period) * 2 * math.pi
-        t = 0.5 * (1.0 + math.sin(phase))
-        state = _lerp_state(a, b, t)
-        nearest_id, _ = _nearest_visual_type(state)
-
-        sequence.append({
-            "step": step,
-            "t": round(t, 4),
-            "state": {k: round(v, 4) for k, v in state.items()},
-            "nearest_type": nearest_id,
-        })
+    steps = range(period)
+    ts = [0.5 * (1.0 + math.sin((step / period) * math.tau)) for step in steps]
 
-    return json.dumps({
+    return {
         "preset_name": preset_name,
         "preset_details": preset,
         "period": period,
-        "state_a": a,
-        "state_b": b,
-        "sequence": sequence,
-    }, indent=2)
+        "state_a": dict(zip(PARAMETER_NAMES, a)),
+        "state_b": dict(zip(PARAMETER_NAMES, b)),
+        "sequence": _oscillation_sequence(a, b, steps, ts),
+    }
+
+
+# Presets are fixed, so each full preset response is computed and
+# serialized once at import
+_RHYTHMIC_PRESET_JSON = {name: _dumps(_rhythmic_preset_payload(name)) for name in RHYTHMIC_PRESETS}
+
+
+@mcp.tool()
+def apply_dissolution_rhythmic_preset(preset_name: str) -> str:
+    """Apply a curated dissolution rhythmic pattern preset. Layer 2 (0 tokens)."""
+    response = _RHYTHMIC_PRESET_JSON.get(preset_name)
+    if response is None:
+        return _dumps({"error": f"Unknown preset: {preset_name}", "valid": list(RHYTHMIC_PRESETS.keys())}, pretty=False)
+    return response
 
 
 @mcp.tool()
@@ -1607,77 +2037,73 @@ def generate_dissolution_sequence_prompts(
 ) -> str:
     """Generate keyframe prompts from a Phase 2.6 rhythmic preset. Layer 2 (0 tokens)."""
     if preset_name not in RHYTHMIC_PRESETS:
-        return json.dumps({"error": f"Unknown preset: {preset_name}", "valid": list(RHYTHMIC_PRESETS.keys())})
+        return _dumps({"error": f"Unknown preset: {preset_name}", "valid": list(RHYTHMIC_PRESETS.keys())}, pretty=False)
 
     preset = RHYTHMIC_PRESETS[preset_name]
-    a_id = preset["state_a"]
-    b_id = preset["state_b"]
-
-    a = VISUAL_TYPES[a_id]["center"] if a_id in VISUAL_TYPES else CANONICAL_STATES[a_id]["coordinates"]
-    b = VISUAL_TYPES[b_id]["center"] if b_id in VISUAL_TYPES else CANONICAL_STATES[b_id]["coordinates"]
-
-    period = preset["period"]
+    ts = [0.5 * (1.0 + math.sin((i / keyframe_count) * math.tau)) for i in range(keyframe_count)]
+    vecs = _lerp_vecs(_state_tuple(preset["state_a"]), _state_tuple(preset["state_b"]), ts)
     keyframes = []
 
-    for i in range(keyframe_count):
-        phase = (i / keyframe_count) * 2 * math.pi
-        t = 0.5 * (1.0 + math.sin(phase))
-        state = _lerp_state(a, b, t)
-        nearest_id, _ = _nearest_visual_type(state)
-        vt = VISUAL_TYPES[nearest_id]
+    # Same style suffix on every keyframe, so format it once
+    modifier = f" {style_modifier}." if style_modifier else ""
 
+    for i, (t, v, (nearest_id, _)) in enumerate(zip(ts, vecs, map(_nearest_vec, vecs))):
+        # One f-string compiles to a single string build; no += re-copy
         prompt = (
-            f"Keyframe {i+1}/{keyframe_count} — {vt['name']}: "
-            f"{vt['keywords'][0]}. {vt['keywords'][1]}. "
-            f"Color: {', '.join(vt['color_associations'][:2])}."
+            f"Keyframe {i+1}/{keyframe_count} — {VISUAL_TYPES[nearest_id]['name']}: "
+            f"{_KEYWORD_PREVIEW[nearest_id]}. "
+            f"Color: {_COLOR_PREVIEW[nearest_id]}.{modifier}"
         )
-        if style_modifier:
-            prompt += f" {style_modifier}."
 
         keyframes.append({
             "keyframe": i + 1,
             "phase_degrees": round((i / keyframe_count) * 360),
             "t": round(t, 4),
-            "state": {k: round(v, 4) for k, v in state.items()},
+            "state": _round_state(v),
             "nearest_type": nearest_id,
             "prompt": prompt,
         })
 
-    return json.dumps({
+    return _dumps({
         "preset_name": preset_name,
         "character": preset["character"],
         "keyframe_count": keyframe_count,
         "keyframes": keyframes,
-    }, indent=2)
+    })
+
+
+# Built only from module constants, so serialized once at import like the
+# Layer 1 payloads
+_REGISTRY_CONFIG_JSON = _dumps({
+    "domain_id": "watercolor_dissolution",
+    "parameter_names": PARAMETER_NAMES,
+    "n_visual_types": len(VISUAL_TYPES),
+    "visual_type_centers": {
+        tid: t["center"] for tid, t in VISUAL_TYPES.items()
+    },
+    "rhythmic_presets": {
+        pid: {
+            "state_a": p["state_a"],
+            "state_b": p["state_b"],
+            "period": p["period"],
+        }
+        for pid, p in RHYTHMIC_PRESETS.items()
+    },
+    "attractor_presets": {
+        pid: {
+            "state": p["state"],
+            "basin_radius": p["basin_radius"],
+        }
+        for pid, p in ATTRACTOR_PRESETS.items()
+    },
+    "bounds": [0.0, 1.0],
+})
 
 
 @mcp.tool()
 def get_dissolution_domain_registry_config() -> str:
     """Get domain config for Tier 4D emergent attractor discovery integration."""
-    return json.dumps({
-        "domain_id": "watercolor_dissolution",
-        "parameter_names": PARAMETER_NAMES,
-        "n_visual_types": len(VISUAL_TYPES),
-        "visual_type_centers": {
-            tid: t["center"] for tid, t in VISUAL_TYPES.items()
-        },
-        "rhythmic_presets": {
-            pid: {
-                "state_a": p["state_a"],
-                "state_b": p["state_b"],
-                "period": p["period"],
-            }
-            for pid, p in RHYTHMIC_PRESETS.items()
-        },
-        "attractor_presets": {
-            pid: {
-                "state": p["state"],
-                "basin_radius": p["basin_radius"],
-            }
-            for pid, p in ATTRACTOR_PRESETS.items()
-        },
-        "bounds": [0.0, 1.0],
-    }, indent=2)
+    return _REGISTRY_CONFIG_JSON
 
 
 # ─────────────────────────────────────────────────────────────────────
@@ -1701,30 +2127,23 @@ def enhance_dissolution_prompt(
         style_override: Optional specific style (auto-detected if not provided)
         substrate: Optional substrate type (hot_press, cold_press, rough, yupo, masa)
         intensity: Enhancement intensity (subtle, moderate, dramatic)"""
-    # Classify intent
-    classification = json.loads(classify_dissolution_intent(user_intent))
+    # Classify intent (payload builders are called directly: no JSON round-trip)
+    classification = _classify_intent(user_intent.lower())
     style_id = style_override or classification["primary_style"]
 
     if style_id not in VISUAL_TYPES:
         style_id = classification["primary_style"]
 
     # Map parameters
-    params = json.loads(map_dissolution_parameters(
-        style_id=style_id,
-        intensity=intensity,
-        substrate=substrate,
-    ))
+    params = _map_parameters(style_id, intensity, "balanced", substrate)
 
     # Generate prompt
-    prompt_data = json.loads(generate_dissolution_attractor_prompt(
-        attractor_id=style_id,
-        mode="composite",
-    ))
+    prompt_data = _attractor_prompt(_attractor_state(style_id, None), "composite", "", 4)
 
     # Get vocabulary
-    vocab = json.loads(extract_dissolution_visual_vocabulary(dissolution_id=style_id))
+    vocab = _interpolate_vocabulary(_vocabulary_coordinates(style_id))
 
-    return json.dumps({
+    return _dumps({
         "classification": {
             "detected_style": classification["primary_style"],
             "applied_style": style_id,
@@ -1752,7 +2171,7 @@ def enhance_dissolution_prompt(
         "color_associations": params["color_associations"],
         "characteristics": params["characteristics"],
         "vocabulary": vocab["vocabulary_by_category"],
-    }, indent=2)
+    })
 
 
 @mcp.tool()
@@ -1763,6 +2182,13 @@ def validate_dissolution_decomposition_round_trip() -> str:
 
     For each visual type, uses its own keywords as the description,
     decomposes back to coordinates, and measures reconstruction error."""
+    return _round_trip_report()
+
+
+@lru_cache(maxsize=1)
+def _round_trip_report() -> str:
+    """Serialized round-trip report; it reads only the static taxonomy, so
+    it is computed on first request and reused."""
     results = {}
     total_error = 0.0
     correct_nearest = 0
@@ -1770,14 +2196,12 @@ def validate_dissolution_decomposition_round_trip() -> str:
     for tid, t in VISUAL_TYPES.items():
         # Use keywords as description
         description = " ".join(t["keywords"])
-        decomposed = json.loads(decompose_dissolution_from_description(description))
+        decomposed = _decompose_description(description.lower())
 
-        # Measure error
+        # Measure error (packed center vs packed rounded recovery)
         original = t["center"]
         recovered = decomposed["coordinates"]
-        error = math.sqrt(sum(
-            (original[k] - recovered[k]) ** 2 for k in PARAMETER_NAMES
-        ))
+        error = _euclidean_distance(_TYPE_COORDS[tid], _state_vec(recovered))
         total_error += error
 
         nearest_correct = decomposed["nearest_type"] == tid
@@ -1795,13 +2219,13 @@ def validate_dissolution_decomposition_round_trip() -> str:
         }
 
     n = len(VISUAL_TYPES)
-    return json.dumps({
+    return _dumps({
         "test": "round_trip_decomposition_fidelity",
         "n_types_tested": n,
         "nearest_type_accuracy": round(correct_nearest / n, 4),
         "mean_reconstruction_error": round(total_error / n, 4),
         "per_type_results": results,
-    }, indent=2)
+    })
 
 
 # ─────────────────────────────────────────────────────────────────────
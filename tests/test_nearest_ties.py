@@ -0,0 +1,80 @@
+"""Regression tests for nearest visual type selection at exact-midpoint ties.
+
+Two squared distances a few ulps apart can round to the same distance; the
+tie must go to the first visual type in declaration order. The reference is
+the original per-key formula, so it follows that Python's own ** and sum()
+rounding (sum() is compensated from 3.12).
+"""
+
+import json
+import math
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src" / "water_dissolution_mcp"))
+
+import watercolor_dissolution_mcp as wd  # noqa: E402
+
+
+def _reference_nearest(state: dict) -> str:
+    """First visual type at minimum distance, over the distance list."""
+    distances = [
+        math.sqrt(sum((state[k] - vt["center"][k]) ** 2 for k in wd.PARAMETER_NAMES))
+        for vt in wd.VISUAL_TYPES.values()
+    ]
+    return list(wd.VISUAL_TYPES)[distances.index(min(distances))]
+
+
+class NearestTypeTieTests(unittest.TestCase):
+
+    def test_trajectory_midpoint(self):
+        result = json.loads(
+            wd.compute_dissolution_trajectory("contested_boundary", "ghost_impression", 20)
+        )
+        step = result["trajectory"][10]
+        self.assertEqual(step["t"], 0.5)
+        self.assertEqual(step["nearest_type"], "contested_boundary")
+
+    def test_rhythmic_sequence_midpoint(self):
+        result = json.loads(
+            wd.generate_dissolution_rhythmic_sequence(
+                "saturated_tide", "contested_boundary", 4, 3, "sinusoidal", 0.0
+            )
+        )
+        step = result["sequence"][0]
+        self.assertEqual(step["t"], 0.5)
+        self.assertEqual(step["nearest_type"], "contested_boundary")
+
+    def test_full_dissolution_contested_boundary_midpoint(self):
+        # chromatic_flood is exactly closer, but only 3.12+'s compensated
+        # sum() resolves it; earlier Pythons pick substrate_emergence
+        result = json.loads(
+            wd.compute_dissolution_trajectory("full_dissolution", "contested_boundary", 2)
+        )
+        v = wd._lerp_vecs(
+            wd._STATE_COORDS["full_dissolution"], wd._STATE_COORDS["contested_boundary"], [0.5]
+        )[0]
+        expected = _reference_nearest(dict(zip(wd.PARAMETER_NAMES, v)))
+        step = result["trajectory"][1]
+        if sys.version_info >= (3, 12):
+            self.assertEqual(expected, "chromatic_flood")
+        self.assertEqual(step["nearest_type"], expected)
+
+    def test_all_pairwise_midpoints_match_reference(self):
+        ids = list(wd.VISUAL_TYPES) + list(wd.CANONICAL_STATES)
+        for a in ids:
+            for b in ids:
+                result = json.loads(wd.compute_dissolution_trajectory(a, b, 2))
+                for step in result["trajectory"]:
+                    v = wd._lerp_vecs(wd._STATE_COORDS[a], wd._STATE_COORDS[b], [step["t"]])[0]
+                    state = dict(zip(wd.PARAMETER_NAMES, v))
+                    expected = _reference_nearest(state)
+                    with self.subTest(a=a, b=b, t=step["t"]):
+                        self.assertEqual(step["nearest_type"], expected)
+                        # The vocabulary path must agree with the trajectory path
+                        self.assertEqual(wd._vocabulary_for_vec(v)[0], expected)
+
+
+if __name__ == "__main__":
+    unittest.main()